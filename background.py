@@ -3,6 +3,7 @@ import os
 
 import globals_
 from ui import GetIcon, HexSpinBox
+from misc import LoadBgANames, LoadBgBNames
 
 # Sets up the Background Dialog
 class BGDialog(QtWidgets.QDialog):
@@ -72,6 +73,10 @@ class BGTab(QtWidgets.QWidget):
             globals_.trans.string('BGDlg', 4)  # 'Backdrop'
         )
 
+        # the background names are only needed here, so load them on demand
+        LoadBgANames()
+        LoadBgBNames()
+
         bg_vals = (z.bg1A, z.bg2A, z.bg3A), (z.bg1B, z.bg2B, z.bg3B)
         bg_names = globals_.BgANames, globals_.BgBNames
         bg_pos_vals = (z.XpositionA, -z.YpositionA), (z.XpositionB, -z.YpositionB)
@@ -878,13 +878,7 @@ class DiagnosticToolDialog(QtWidgets.QDialog):
         if globals_.Area.areanum != 1:
             return False
 
-        start = None
-        for ent in globals_.Area.entrances:
-            if ent.entid == globals_.Area.startEntrance:
-                start = ent
-            else:
-                problem = False
-        problem = start is None
+        problem = globals_.Area.GetEntrance(globals_.Area.startEntrance) is None
 
         if mode == 'c':
             return problem
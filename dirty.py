@@ -2,6 +2,10 @@ from PyQt5 import QtCore
 
 import globals_
 
+# Names under which the type of each setting is stored, and back
+SettingTypeNames = {str: 'str', int: 'int', float: 'float', dict: 'dict', bool: 'bool', QtCore.QByteArray: 'QByteArray', type(None): 'NoneType'}
+SettingTypes = {'str': str, 'int': int, 'float': float, 'dict': dict, 'bool': bool, 'QByteArray': QtCore.QByteArray}
+
 def SetDirty(noautosave = False):
     if globals_.DirtyOverride > 0: return
 
@@ -19,23 +23,19 @@ def setting(name, default=None):
     """
     Thin wrapper around QSettings, fixes the type=bool bug
     """
-    types_str = {str: 'str', int: 'int', float: 'float', dict: 'dict', bool: 'bool', QtCore.QByteArray: 'QByteArray', type(None): 'NoneType'}
-    types = {'str': str, 'int': int, 'float': float, 'dict': dict, 'bool': bool, 'QByteArray': QtCore.QByteArray}
-
-    type_ = globals_.settings.value('typeof(%s)' % name, types_str[type(default)], str)
+    type_ = globals_.settings.value('typeof(%s)' % name, SettingTypeNames[type(default)], str)
     if type_ == 'NoneType':
         return None
 
-    return globals_.settings.value(name, default, types[type_])
+    return globals_.settings.value(name, default, SettingTypes[type_])
 
 
 def setSetting(name, value):
     """
     Thin wrapper around QSettings
     """
-    types_str = {str: 'str', int: 'int', float: 'float', dict: 'dict', bool: 'bool', QtCore.QByteArray: 'QByteArray', type(None): 'NoneType'}
-    assert isinstance(name, str) and type(value) in types_str
+    assert isinstance(name, str) and type(value) in SettingTypeNames
 
     globals_.settings.setValue(name, value)
-    globals_.settings.setValue('typeof(%s)' % name, types_str[type(value)])
+    globals_.settings.setValue('typeof(%s)' % name, SettingTypeNames[type(value)])
 
@@ -6,7 +6,7 @@ from xml.etree import ElementTree as etree
 from PyQt5 import QtWidgets, QtCore, QtGui
 
 from ui import GetIcon, createVertLine
-from misc import LoadSpriteData, LoadSpriteListData, LoadSpriteCategories, LoadBgANames, LoadBgBNames, LoadObjDescriptions, LoadTilesetNames, LoadTilesetInfo, LoadEntranceNames
+from misc import LoadSpriteData, LoadSpriteListData, LoadSpriteCategories, LoadObjDescriptions, LoadTilesetNames, LoadTilesetInfo, LoadEntranceNames
 from dirty import setting, setSetting
 
 import globals_
@@ -402,13 +402,18 @@ class ReggieGameDefinition:
             paths.append(stg)
             return paths
 
+    def LastLevelKey(self):
+        """
+        Returns the name of the setting the last loaded level is stored in
+        """
+        return ('LastLevel_' + self.name) if self.custom else 'LastLevel'
+
     def GetLastLevel(self):
         """
         Returns the last loaded level
         """
         if not self.custom: return setting('LastLevel')
-        name = 'LastLevel_' + self.name
-        stg = setting(name)
+        stg = setting(self.LastLevelKey())
 
         # Use the default if there are no settings for this yet
         if stg is None:
@@ -422,11 +427,8 @@ class ReggieGameDefinition:
         """
         if path in (None, 'None', 'none', True, 'True', 'true', False, 'False', 'false', 0, 1, ''): return
         print('Last loaded level set to ' + str(path))
-        if not self.custom:
-            setSetting('LastLevel', path)
-        else:
-            name = 'LastLevel_' + self.name
-            setSetting(name, path)
+        setSetting(self.LastLevelKey(), path)
+        globals_.LastLevel = path
 
     def recursiveFiles(self, name, isPatch=False, folder=False):
         """
@@ -591,6 +593,7 @@ def LoadGameDef(name=None, dlg=None):
         # Load the globals_.gamedef
         if dlg: dlg.setLabelText(globals_.trans.string('Gamedefs', 1))  # Loading game patch...
         globals_.gamedef = ReggieGameDefinition(name)
+        globals_.LastLevel = setting(globals_.gamedef.LastLevelKey())
         if globals_.gamedef.custom and (not globals_.settings.contains('GamePath_' + globals_.gamedef.name)):
             # First-time usage of this globals_.gamedef. Have the
             # user pick a stage folder so we can load stages
@@ -627,8 +630,9 @@ def LoadGameDef(name=None, dlg=None):
 
         # Load BgA/BgB names
         if dlg: dlg.setLabelText(globals_.trans.string('Gamedefs', 9))  # Loading background names...
-        LoadBgANames(True)
-        LoadBgBNames(True)
+        # these are loaded again the next time the background dialog opens
+        globals_.BgANames = None
+        globals_.BgBNames = None
         if dlg: dlg.setValue(3)
 
         # Reload tilesets
@@ -30,6 +30,7 @@ ErrMsg = ''
 FileExtentions = ('.arc', '.arc.LH')
 GridType = None
 HideResetSpritedata = False
+LastLevel = None
 Layer0Shown = True
 Layer1Shown = True
 Layer2Shown = True
@@ -73,6 +74,7 @@ TilesetFilesLoaded = [None, None, None, None]
 TilesetInfo = None
 TilesetNames = None
 TilesetsAnimating = False
+ToolbarActs = None
 UpdateURL = ''
 
 app = None
@@ -262,6 +262,10 @@ class AbstractParsedArea(AbstractArea):
         self.comments = []
         self.layers = [[], [], []]
 
+        # Bumped whenever objects are added to, removed from or moved between
+        # the layers, so cached lookups know their indices are outdated
+        self.layerGeneration = 0
+
         # Metadata
         self.LoadReggieInfo(None)
 
@@ -323,6 +327,23 @@ class AbstractParsedArea(AbstractArea):
 
         return True
 
+    @property
+    def tilesets(self):
+        """
+        The names of the tilesets in slots 0 to 3
+        """
+        return (self.tileset0, self.tileset1, self.tileset2, self.tileset3)
+
+    def GetEntrance(self, entid):
+        """
+        Returns the first entrance with the given id, or None
+        """
+        for ent in self.entrances:
+            if ent.entid == entid:
+                return ent
+
+        return None
+
     def save(self):
         """
         Save the area back to a file
@@ -385,6 +406,7 @@ class AbstractParsedArea(AbstractArea):
         layer = self.layers[obj.layer]
         idx = layer.index(obj)
         del layer[idx]
+        self.layerGeneration += 1
 
         for upd in layer[idx:]:
             upd.setZValue(upd.zValue() - 1)
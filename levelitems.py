@@ -473,6 +473,7 @@ class ObjectItem(LevelEditorItem):
         self.width = width
         self.height = height
         self.objdata = None
+        self.TileRect = QtCore.QRectF(x * 24, y * 24, width * 24, height * 24)
 
         self.TLGrabbed = self.TRGrabbed = self.BLGrabbed = self.BRGrabbed = False
         self.MTGrabbed = self.MLGrabbed = self.MBGrabbed = self.MRGrabbed = False
@@ -529,6 +530,34 @@ class ObjectItem(LevelEditorItem):
         """
         self.objdata = RenderObject(self.tileset, self.type, self.width, self.height)
         self.randomise()
+        self.updateHasTiles()
+
+    def updateHasTiles(self):
+        """
+        Checks whether the rendered object data contains any visible tiles,
+        so the background painter can skip objects that draw nothing
+        """
+        odefs = globals_.ObjectDefinitions
+        if odefs is None or odefs[self.tileset] is None or odefs[self.tileset][self.type] is None:
+            # unknown objects are drawn using the unknown tile
+            self.hasTiles = True
+        else:
+            self.hasTiles = any(tile > 0 for row in self.objdata for tile in row)
+
+        self.invalidateTiles()
+
+    def invalidateTiles(self):
+        """
+        Marks the rendered tiles under the object's previous and current
+        areas as outdated
+        """
+        rect = QtCore.QRectF(self.objx * 24, self.objy * 24, self.width * 24, self.height * 24)
+        scene = self.scene()
+        if scene is not None:
+            scene.updateObjectLeaf(self)
+            scene.invalidateObjects(self.TileRect, rect)
+
+        self.TileRect = rect
 
     def isBottomRowSpecial(self):
         """
@@ -723,6 +752,8 @@ class ObjectItem(LevelEditorItem):
                 self.objdata[y] += new[y]
             self.randomise(self.width, 0, width - self.width, height)
 
+        self.updateHasTiles()
+
     def UpdateRects(self):
         """
         Recreates the bounding and selection rects
@@ -756,6 +787,7 @@ class ObjectItem(LevelEditorItem):
         self.GrabberRectMR_ = QtCore.QRectF(longwidth + grabbersize, grabbersize, grabbersize, longheight)
 
         self.LevelRect = QtCore.QRectF(self.objx, self.objy, self.width, self.height)
+        self.invalidateTiles()
 
     def itemChange(self, change, value):
         """
@@ -789,6 +821,7 @@ class ObjectItem(LevelEditorItem):
                 oldy = self.objy
                 self.objx = x
                 self.objy = y
+                self.invalidateTiles()
                 if self.positionChanged is not None:
                     self.positionChanged(self, oldx, oldy, x, y)
 
@@ -1762,30 +1795,30 @@ class SpriteItem(LevelEditorItem):
         baseString = globals_.trans.string('Sprites', 1, '[name]', self.name, '[x]', self.objx, '[y]', self.objy)
 
         # global globals_.SpriteListData
-        SpritesThatActivateAnEvent = set(globals_.SpriteListData[0])
-        SpritesThatActivateAnEventNyb0 = set(globals_.SpriteListData[1])
-        SpritesTriggeredByAnEventNyb1 = set(globals_.SpriteListData[2])
-        SpritesTriggeredByAnEventNyb0 = set(globals_.SpriteListData[3])
-        StarCoinNumbers = set(globals_.SpriteListData[4])
-        SpritesWithSetIDs = set(globals_.SpriteListData[5])
-        SpritesWithMovementIDsNyb2 = set(globals_.SpriteListData[6])
-        SpritesWithMovementIDsNyb3 = set(globals_.SpriteListData[7])
-        SpritesWithMovementIDsNyb5 = set(globals_.SpriteListData[8])
-        SpritesWithRotationIDs = set(globals_.SpriteListData[9])
-        SpritesWithLocationIDsNyb5 = set(globals_.SpriteListData[10])
-        SpritesWithLocationIDsNyb5and0xF = set(globals_.SpriteListData[11])
-        SpritesWithLocationIDsNyb4 = set(globals_.SpriteListData[12])
-        AndController = set(globals_.SpriteListData[13])
-        OrController = set(globals_.SpriteListData[14])
-        MultiChainer = set(globals_.SpriteListData[15])
-        Random = set(globals_.SpriteListData[16])
-        Clam = set(globals_.SpriteListData[17])
-        Coin = set(globals_.SpriteListData[18])
-        MushroomScrewPlatforms = set(globals_.SpriteListData[19])
-        SpritesWithMovementIDsNyb5Type2 = set(globals_.SpriteListData[20])
-        BowserFireballArea = set(globals_.SpriteListData[21])
-        CheepCheepArea = set(globals_.SpriteListData[22])
-        PoltergeistItem = set(globals_.SpriteListData[23])
+        SpritesThatActivateAnEvent = globals_.SpriteListData[0]
+        SpritesThatActivateAnEventNyb0 = globals_.SpriteListData[1]
+        SpritesTriggeredByAnEventNyb1 = globals_.SpriteListData[2]
+        SpritesTriggeredByAnEventNyb0 = globals_.SpriteListData[3]
+        StarCoinNumbers = globals_.SpriteListData[4]
+        SpritesWithSetIDs = globals_.SpriteListData[5]
+        SpritesWithMovementIDsNyb2 = globals_.SpriteListData[6]
+        SpritesWithMovementIDsNyb3 = globals_.SpriteListData[7]
+        SpritesWithMovementIDsNyb5 = globals_.SpriteListData[8]
+        SpritesWithRotationIDs = globals_.SpriteListData[9]
+        SpritesWithLocationIDsNyb5 = globals_.SpriteListData[10]
+        SpritesWithLocationIDsNyb5and0xF = globals_.SpriteListData[11]
+        SpritesWithLocationIDsNyb4 = globals_.SpriteListData[12]
+        AndController = globals_.SpriteListData[13]
+        OrController = globals_.SpriteListData[14]
+        MultiChainer = globals_.SpriteListData[15]
+        Random = globals_.SpriteListData[16]
+        Clam = globals_.SpriteListData[17]
+        Coin = globals_.SpriteListData[18]
+        MushroomScrewPlatforms = globals_.SpriteListData[19]
+        SpritesWithMovementIDsNyb5Type2 = globals_.SpriteListData[20]
+        BowserFireballArea = globals_.SpriteListData[21]
+        CheepCheepArea = globals_.SpriteListData[22]
+        PoltergeistItem = globals_.SpriteListData[23]
 
         # Triggered by an Event
         if self.type in SpritesTriggeredByAnEventNyb1 and self.spritedata[1] != '\0':
@@ -317,7 +317,7 @@ cpdef bytes UncompressLH(src):
         u32 srcSize = <u32>len(src)
 
         u32 dstSize = LHDecompressor_getDecompSize(srcp)
-        array.array dstArr = array.array('B', bytes(dstSize))
+        array.array dstArr = array.clone(srcArr, dstSize, True)
         res = LHDecompressor_decomp(dstArr.data.as_uchars, srcp, srcSize)
 
     if res != 0:
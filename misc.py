@@ -57,25 +57,34 @@ def IsNSMBLevel(filename):
     """
     Does some basic checks to confirm a file is a NSMB level
     """
-    if not os.path.isfile(filename): return False
+    return ReadNSMBLevel(filename) is not None
 
-    with open(filename, 'rb') as f:
-        data = f.read()
+
+def ReadNSMBLevel(filename):
+    """
+    Reads and decompresses a level file, returning its data if it passes the
+    checks of IsNSMBLevel, or None otherwise
+    """
+    try:
+        with open(filename, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
 
     globals_.compressed = False
 
     if (data[0] & 0xF0) == 0x40:  # If LH-compressed
         try:
             data = lh.UncompressLH(data)
-        except IndexError:
+        except (IndexError, RuntimeError):
             QtWidgets.QMessageBox.warning(None, globals_.trans.string('Err_Decompress', 0),
                                           globals_.trans.string('Err_Decompress', 1, '[file]', filename))
-            return False
+            return None
 
         globals_.compressed = True
 
     if checkContent(data):
-        return True
+        return data
 
 
 def FilesAreMissing():
@@ -626,6 +635,23 @@ class SpriteDefinition:
 
         return bit_ranges, 1 << bit_length
 
+def LowestFreeId(ids, first=0, limit=256):
+    """
+    Returns the lowest id in range(first, limit) that is not in ids, or None
+    if all of them are in use
+    """
+    used = 0
+    for id_ in ids:
+        used |= 1 << id_
+
+    free = ~used & ((1 << limit) - (1 << first))
+    if free == 0:
+        return None
+
+    # isolate the lowest set bit
+    return (free & -free).bit_length() - 1
+
+
 def LoadSpriteData():
     """
     Ensures that the sprite data info is loaded
@@ -826,7 +852,7 @@ def LoadSpriteListData(reload_=False):
     for path in paths: new.append(path)
     paths = new
 
-    globals_.SpriteListData = [[] for _ in range(24)]
+    globals_.SpriteListData = [set() for _ in range(24)]
     for path in paths:
         with open(path) as f:
             data = f.read()
@@ -842,9 +868,7 @@ def LoadSpriteListData(reload_=False):
                     newitem = int(item)
                 except ValueError:
                     continue
-                if newitem in globals_.SpriteListData[lineidx]: continue
-                globals_.SpriteListData[lineidx].append(newitem)
-            globals_.SpriteListData[lineidx].sort()
+                globals_.SpriteListData[lineidx].add(newitem)
 
 
 def LoadEntranceNames(reload_=False):
@@ -1317,7 +1341,8 @@ class ZoomWidget(QtWidgets.QWidget):
         """
         Handle the slider being moved
         """
-        globals_.mainWindow.ZoomTo(globals_.mainWindow.ZoomLevels[self.slider.value()])
+        zi = self.slider.value()
+        globals_.mainWindow.ZoomTo(globals_.mainWindow.ZoomLevels[zi], zi)
 
     def setZoomLevel(self, newLevel):
         """
@@ -1361,6 +1386,48 @@ class ZoomStatusWidget(QtWidgets.QWidget):
             self.label.setText(str(float(zoomLevel)) + '%')
 
 
+class LazyDockWidget(QtWidgets.QDockWidget):
+    """
+    Dock widget that only creates its contents once they are first needed
+    """
+
+    def __init__(self, title, parent, create):
+        """
+        Creates the dock. create is called without arguments to make the
+        contents when the dock is first shown or its contents are requested.
+        """
+        QtWidgets.QDockWidget.__init__(self, title, parent)
+        self.create = create
+        self.visibilityChanged.connect(self.handleVisibilityChanged)
+
+    def contents(self):
+        """
+        Returns the contents of the dock, creating them if needed
+        """
+        if self.create is not None:
+            create, self.create = self.create, None
+            self.setWidget(create())
+
+        return self.widget()
+
+    def setVisible(self, visible):
+        """
+        Makes sure the contents exist before the dock is shown
+        """
+        if visible:
+            self.contents()
+
+        QtWidgets.QDockWidget.setVisible(self, visible)
+
+    def handleVisibilityChanged(self, visible):
+        """
+        Creates the contents if the dock was shown by Qt itself, for example
+        when restoring the window state
+        """
+        if visible:
+            self.contents()
+
+
 def LoadActionsLists():
     # Define the menu items, their default settings and their globals_.mainWindow.actions keys
     # These are used both in the Preferences Dialog and when init'ing the toolbar.
@@ -1428,6 +1495,39 @@ def LoadActionsLists():
     )
 
 
+def GetToolbarActs():
+    """
+    Returns a dict mapping each action key to whether it is shown on the
+    toolbar
+    """
+    if globals_.ToolbarActs is None:
+        globals_.ToolbarActs = _ReadToolbarActs()
+
+    return globals_.ToolbarActs
+
+
+def _ReadToolbarActs():
+    """
+    Reads the ToolbarActs setting, falling back to the default actions
+    """
+    toggled = setting('ToolbarActs')
+    if toggled in (None, 'None', 'none', '', 0):
+        # Get the default settings
+        toggled = {}
+        for List in (globals_.FileActions, globals_.EditActions, globals_.ViewActions, globals_.SettingsActions, globals_.HelpActions):
+            for name, activated, key in List:
+                toggled[key] = activated
+
+        return toggled
+
+    # Get the settings from the .ini. PyQt5 already returns python strings, so
+    # the keys only need to be converted if they are QStrings.
+    if all(isinstance(key, str) for key in toggled):
+        return toggled
+
+    return {str(key): value for key, value in toggled.items()}
+
+
 class PreferencesDialog(QtWidgets.QDialog):
     """
     Dialog which lets you customize Reggie
@@ -1618,19 +1718,7 @@ class PreferencesDialog(QtWidgets.QDialog):
                 QtWidgets.QWidget.__init__(self)
 
                 # Determine which keys are activated
-                if setting('ToolbarActs') in (None, 'None', 'none', '', 0):
-                    # Get the default settings
-                    toggled = {}
-                    for List in (globals_.FileActions, globals_.EditActions, globals_.ViewActions, globals_.SettingsActions, globals_.HelpActions):
-                        for name, activated, key in List:
-                            toggled[key] = activated
-                else:
-                    # Get the settings from the .ini
-                    toggled = setting('ToolbarActs')
-                    newToggled = {}  # here, I'm replacing QStrings w/ python strings
-                    for key in toggled:
-                        newToggled[str(key)] = toggled[key]
-                    toggled = newToggled
+                toggled = GetToolbarActs()
 
                 # Create some data
                 self.FileBoxes = []
@@ -1664,10 +1752,9 @@ class PreferencesDialog(QtWidgets.QDialog):
                         box = QtWidgets.QCheckBox(L.replace('<br>', ' '))
                         boxes.append(box)
                         layout.addWidget(box)
-                        try:
-                            box.setChecked(toggled[I])
-                        except KeyError:
-                            pass
+                        checked = toggled.get(I)
+                        if checked is not None:
+                            box.setChecked(checked)
                         box.InternalName = I  # to save settings later
                     group.setLayout(layout)
 
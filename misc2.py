@@ -1,4 +1,5 @@
 import math
+from bisect import bisect_left
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
@@ -7,6 +8,81 @@ from levelitems import ListWidgetItem_SortsByOther, PathItem, CommentItem, Sprit
 from dirty import SetDirty
 import pickletools
 
+def _SpreadBits(value):
+    """
+    Spreads the 8 bits of value out so there is a zero bit between each of them
+    """
+    result = 0
+    for i in range(8):
+        result |= ((value >> i) & 1) << (2 * i)
+    return result
+
+
+# Lookup table used to interleave coordinates into Morton (Z-order) codes
+MortonSpread = tuple(_SpreadBits(i) for i in range(256))
+
+# The object grid is 1024x512 tiles, so 10 quadtree levels cover all of it
+ZMapLevels = 10
+ZMapLeafSize = 32
+
+# Rendered tiles are cached in square chunks of this many tiles
+TileChunkSize = 32
+TileChunkCacheSize = 48
+
+
+def MortonCode(x, y):
+    """
+    Interleaves the bits of two tile coordinates into a Morton code
+    """
+    spread = MortonSpread
+    mx = spread[x & 0xFF] | (spread[(x >> 8) & 0xFF] << 16)
+    my = spread[y & 0xFF] | (spread[(y >> 8) & 0xFF] << 16)
+    return mx | (my << 1)
+
+
+def BuildZMapLeaves(layer):
+    """
+    Builds a linear PR-quadtree over the objects in a layer. Returns a list of
+    [x1, y1, x2, y2, indices] leaves, where the bounds are the union of the
+    object rects in the leaf and indices are the positions in the layer.
+    """
+    maxcoord = (1 << ZMapLevels) - 1
+    entries = sorted(
+        (MortonCode(min(max(obj.objx, 0), maxcoord), min(max(obj.objy, 0), maxcoord)), i)
+        for i, obj in enumerate(layer)
+    )
+    codes = [code for code, _ in entries]
+
+    leaves = []
+    stack = [(0, 0)]
+    while stack:
+        level, prefix = stack.pop()
+        shift = 2 * (ZMapLevels - level)
+        lo = bisect_left(codes, prefix << shift)
+        hi = bisect_left(codes, (prefix + 1) << shift)
+
+        if lo == hi:
+            continue
+
+        if hi - lo > ZMapLeafSize and level < ZMapLevels:
+            # too many objects in this quadrant, so split it up
+            prefix <<= 2
+            stack.extend((level + 1, prefix | quadrant) for quadrant in range(4))
+            continue
+
+        indices = [i for _, i in entries[lo:hi]]
+        objs = [layer[i] for i in indices]
+        leaves.append([
+            min(obj.objx for obj in objs),
+            min(obj.objy for obj in objs),
+            max(obj.objx + obj.width for obj in objs),
+            max(obj.objy + obj.height for obj in objs),
+            indices,
+        ])
+
+    return leaves
+
+
 class LevelScene(QtWidgets.QGraphicsScene):
     """
     GraphicsScene subclass for the level scene
@@ -14,8 +90,136 @@ class LevelScene(QtWidgets.QGraphicsScene):
 
     def __init__(self, *args):
         self.bgbrush = QtGui.QBrush(globals_.theme.color('bg'))
+        self._zmap = None
+        self._zmapLeaves = None
+        self._zmapKey = None
+        self._tileChunks = {}
+        self._tileChunksKey = None
         QtWidgets.QGraphicsScene.__init__(self, *args)
 
+    def addItem(self, item):
+        """
+        Adds an item to the scene, marking the object caches as outdated if
+        it is an object
+        """
+        QtWidgets.QGraphicsScene.addItem(self, item)
+        if isinstance(item, ObjectItem):
+            self._zmap = None
+            self.invalidateObjects(item.TileRect)
+
+    def removeItem(self, item):
+        """
+        Removes an item from the scene, marking the object caches as outdated
+        if it is an object
+        """
+        QtWidgets.QGraphicsScene.removeItem(self, item)
+        if isinstance(item, ObjectItem):
+            self._zmap = None
+            self.invalidateObjects(item.TileRect)
+
+    def clear(self):
+        """
+        Removes all items from the scene, along with every object cache, as
+        it is only cleared when a new area is loaded
+        """
+        QtWidgets.QGraphicsScene.clear(self)
+        self._zmap = None
+        self._zmapLeaves = None
+        self._zmapKey = None
+        self.invalidateObjects()
+
+    def invalidateObjects(self, *rects):
+        """
+        Marks the rendered tile chunks overlapping the given scene rects as
+        outdated, or all of them if no rects are given
+        """
+        chunks = self._tileChunks
+        if not rects:
+            chunks.clear()
+            return
+
+        chunkpx = TileChunkSize * 24
+        for rect in rects:
+            # chunks also draw the objects starting one tile past their edges
+            cx1 = (rect.left() - 24) // chunkpx
+            cy1 = (rect.top() - 24) // chunkpx
+            cx2 = rect.right() // chunkpx
+            cy2 = rect.bottom() // chunkpx
+
+            for key in [key for key in chunks if cx1 <= key[0] <= cx2 and cy1 <= key[1] <= cy2]:
+                del chunks[key]
+
+    def updateObjectLeaf(self, obj):
+        """
+        Grows the spatial index leaf holding an object to cover its current
+        area, so moving or resizing it doesn't rebuild the whole index. The
+        leaf bounds are tightened again the next time the index is rebuilt.
+        """
+        if self._zmap is None:
+            return
+
+        leaf = self._zmapLeaves.get(id(obj))
+        if leaf is None:
+            # the object isn't in the index yet
+            self._zmap = None
+            return
+
+        leaf[0] = min(leaf[0], obj.objx)
+        leaf[1] = min(leaf[1], obj.objy)
+        leaf[2] = max(leaf[2], obj.objx + obj.width)
+        leaf[3] = max(leaf[3], obj.objy + obj.height)
+
+    def checkLayers(self):
+        """
+        Marks the object caches as outdated if the area has been replaced or
+        its layers have been reordered since they were built
+        """
+        area = globals_.Area
+        if self._zmapKey is None or self._zmapKey[0] is not area:
+            # a different area, so nothing cached is valid anymore
+            self._zmap = None
+            self.invalidateObjects()
+        elif self._zmapKey[1] != area.layerGeneration:
+            self._zmap = None
+
+        self._zmapKey = (area, area.layerGeneration)
+
+    def layerItemsInRect(self, idx, rect):
+        """
+        Returns the objects in the given layer that intersect rect (in tiles),
+        in the same order as they appear in the layer
+        """
+        self.checkLayers()
+
+        layers = globals_.Area.layers
+        if self._zmap is None:
+            self._zmap = [BuildZMapLeaves(layer) for layer in layers]
+            self._zmapLeaves = {
+                id(layer[i]): leaf
+                for layer, leaves in zip(layers, self._zmap)
+                for leaf in leaves
+                for i in leaf[4]
+            }
+
+        layer = layers[idx]
+        isect = rect.intersects
+        rx1, ry1 = rect.x(), rect.y()
+        rx2, ry2 = rx1 + rect.width(), ry1 + rect.height()
+
+        # objects are indexed by their top-left tile but can span up to
+        # 1023x511 tiles, so the Morton range of rect doesn't bound the
+        # leaves that may reach into it. There are only about len(layer) / 32
+        # leaves, so check all of their bounds instead.
+        found = []
+        for x1, y1, x2, y2, indices in self._zmap[idx]:
+            if x1 >= rx2 or x2 <= rx1 or y1 >= ry2 or y2 <= ry1:
+                continue
+
+            found.extend(i for i in indices if isect(layer[i].LevelRect))
+
+        found.sort()
+        return [layer[i] for i in found]
+
     def drawBackground(self, painter, rect):
         """
         Draws all visible tiles
@@ -23,8 +227,67 @@ class LevelScene(QtWidgets.QGraphicsScene):
         painter.fillRect(rect, self.bgbrush)
         if not hasattr(globals_.Area, 'layers'): return
 
+        chunkpx = TileChunkSize * 24
+        cx1 = max(int(rect.left() // chunkpx), 0)
+        cy1 = max(int(rect.top() // chunkpx), 0)
+        cx2 = int(rect.right() // chunkpx)
+        cy2 = int(rect.bottom() // chunkpx)
+
+        if globals_.TilesetsAnimating or (cx2 - cx1 + 1) * (cy2 - cy1 + 1) > TileChunkCacheSize:
+            # animated tiles change every frame, and zoomed out views would
+            # need too many chunks, so draw the tiles directly
+            self.drawTiles(painter, rect)
+            return
+
+        self.checkLayers()
+
+        key = (globals_.CollisionsShown, globals_.Layer0Shown, globals_.Layer1Shown, globals_.Layer2Shown)
+        if self._tileChunksKey != key:
+            self._tileChunks.clear()
+            self._tileChunksKey = key
+
+        chunks = self._tileChunks
+        for cy in range(cy1, cy2 + 1):
+            for cx in range(cx1, cx2 + 1):
+                # move the chunk to the end, so the least recently used
+                # chunks are evicted first
+                pix = chunks.pop((cx, cy), None)
+                if pix is None:
+                    pix = self.renderTileChunk(cx, cy)
+                    while len(chunks) >= TileChunkCacheSize:
+                        del chunks[next(iter(chunks))]
+
+                chunks[(cx, cy)] = pix
+                if pix is False:
+                    continue
+
+                chunkrect = QtCore.QRectF(cx * chunkpx, cy * chunkpx, chunkpx, chunkpx)
+                target = chunkrect.intersected(rect)
+                painter.drawPixmap(target, pix, target.translated(-chunkrect.x(), -chunkrect.y()))
+
+    def renderTileChunk(self, cx, cy):
+        """
+        Renders the tiles in a chunk to a pixmap. Returns False if the chunk
+        is empty.
+        """
+        chunkpx = TileChunkSize * 24
+
+        pix = QtGui.QPixmap(chunkpx, chunkpx)
+        pix.fill(QtCore.Qt.transparent)
+
+        painter = QtGui.QPainter(pix)
+        painter.translate(-cx * chunkpx, -cy * chunkpx)
+        drawn = self.drawTiles(painter, QtCore.QRectF(cx * chunkpx, cy * chunkpx, chunkpx, chunkpx))
+        painter.end()
+
+        return pix if drawn else False
+
+    def drawTiles(self, painter, rect):
+        """
+        Draws the tiles of all visible objects intersecting rect. Returns
+        whether any objects were drawn.
+        """
         drawrect = QtCore.QRectF(rect.x() / 24, rect.y() / 24, rect.width() / 24 + 1, rect.height() / 24 + 1)
-        isect = drawrect.intersects
 
         layer0 = []
         layer1 = []
@@ -38,12 +301,13 @@ class LevelScene(QtWidgets.QGraphicsScene):
         # iterate through each object
         funcs = [layer0.append, layer1.append, layer2.append]
         show = [globals_.Layer0Shown, globals_.Layer1Shown, globals_.Layer2Shown]
-        for layer, add, process in zip(globals_.Area.layers, funcs, show):
+        for idx, (add, process) in enumerate(zip(funcs, show)):
             if not process:
                 continue
 
-            for item in layer:
-                if not isect(item.LevelRect):
+            for item in self.layerItemsInRect(idx, drawrect):
+                if not item.hasTiles:
+                    # nothing would be drawn for this object anyway
                     continue
 
                 add(item)
@@ -112,6 +376,8 @@ class LevelScene(QtWidgets.QGraphicsScene):
 
             painter.restore()
 
+        return bool(layer0 or layer1 or layer2)
+
     def getMainWindow(self):
         return globals_.mainWindow
 
@@ -321,8 +587,8 @@ class LevelViewWidget(QtWidgets.QGraphicsView):
                     plist.clear()
                     for fpath in globals_.Area.pathdata:
                         for fpnode in fpath['nodes']:
-                            fpnode['graphicsitem'].listitem = QtWidgets.QListWidgetItem(
-                                fpnode['graphicsitem'].ListString())
+                            fpnode['graphicsitem'].listitem = ListWidgetItem_SortsByOther(fpnode['graphicsitem'],
+                                                                                          fpnode['graphicsitem'].ListString())
                             plist.addItem(fpnode['graphicsitem'].listitem)
                             fpnode['graphicsitem'].updateId()
                     newnode.listitem.setSelected(True)
@@ -44,9 +44,12 @@ if currentRunningVersion < minimum:
 
 # Stdlib imports
 import os.path
+import re
 import time
 import traceback
 import struct
+from itertools import chain
+from operator import methodcaller
 
 # PyQt5: import, and error msg if not installed
 try:
@@ -91,7 +94,7 @@ import globals_
 
 from libs import lh
 from ui import GetIcon, SetAppStyle, GetDefaultStyle, ListWidgetWithToolTipSignal, LoadNumberFont, LoadTheme
-from misc import LoadActionsLists, LoadTilesetNames, LoadBgANames, LoadBgBNames, LoadConstantLists, LoadObjDescriptions, LoadSpriteData, LoadSpriteListData, LoadEntranceNames, LoadTilesetInfo, FilesAreMissing, module_path, IsNSMBLevel, ChooseLevelNameDialog, LoadLevelNames, PreferencesDialog, LoadSpriteCategories, ZoomWidget, ZoomStatusWidget, RecentFilesMenu, SetGamePath, isValidGamePath
+from misc import LoadActionsLists, LoadTilesetNames, LoadConstantLists, LoadObjDescriptions, LoadSpriteData, LoadSpriteListData, LoadEntranceNames, LoadTilesetInfo, FilesAreMissing, module_path, IsNSMBLevel, ReadNSMBLevel, ChooseLevelNameDialog, LoadLevelNames, PreferencesDialog, LoadSpriteCategories, ZoomWidget, ZoomStatusWidget, RecentFilesMenu, LazyDockWidget, GetToolbarActs, LowestFreeId, SetGamePath, isValidGamePath
 from misc2 import LevelScene, LevelViewWidget
 from dirty import setting, setSetting, SetDirty
 from gamedef import GameDefMenu, LoadGameDef
@@ -198,6 +201,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         self.SelectionUpdateFlag = False
         self.selObj = None
         self.CurrentSelection = []
+        self.CurrentSelectionIds = None
 
         # set up the window
         QtWidgets.QMainWindow.__init__(self, None)
@@ -209,31 +213,70 @@ class ReggieWindow(QtWidgets.QMainWindow):
         # create the level view
         self.scene = LevelScene(0, 0, 1024 * 24, 512 * 24, self)
         self.scene.setItemIndexMethod(QtWidgets.QGraphicsScene.NoIndex)
-        self.scene.selectionChanged.connect(self.ChangeSelectionHandler)
+
+        # selection and hover signals fire on every mouse move, so only
+        # handle them once per event loop iteration
+        self.selectionChangeTimer = QtCore.QTimer(self)
+        self.selectionChangeTimer.setSingleShot(True)
+        self.selectionChangeTimer.setInterval(0)
+        self.selectionChangeTimer.timeout.connect(lambda: self.ChangeSelectionHandler(True))
+        self.scene.selectionChanged.connect(self.selectionChangeTimer.start)
+
+        self.hoverPos = (0, 0)
+        self.positionHoverTimer = QtCore.QTimer(self)
+        self.positionHoverTimer.setSingleShot(True)
+        self.positionHoverTimer.setInterval(0)
+        self.positionHoverTimer.timeout.connect(lambda: self.PositionHovered(*self.hoverPos))
 
         self.view = LevelViewWidget(self.scene, self)
         self.view.centerOn(0, 0)  # this scrolls to the top left
-        self.view.PositionHover.connect(self.PositionHovered)
-        self.view.XScrollBar.valueChanged.connect(self.XScrollChange)
-        self.view.YScrollBar.valueChanged.connect(self.YScrollChange)
+        self.view.PositionHover.connect(self.QueuePositionHovered)
+
+        # scroll bars change on every pixel while scrolling, so only update
+        # the overview at about 30 fps
+        self.scrollChangeTimer = QtCore.QTimer(self)
+        self.scrollChangeTimer.setSingleShot(True)
+        self.scrollChangeTimer.setInterval(33)
+        self.scrollChangeTimer.timeout.connect(self.FlushScrollChange)
+        self.view.XScrollBar.valueChanged.connect(self.QueueScrollChange)
+        self.view.YScrollBar.valueChanged.connect(self.QueueScrollChange)
         self.view.FrameSize.connect(self.HandleWindowSizeChange)
 
+        # resize the zone grabbers once after a burst of zoom changes
+        self.zoneRectsTimer = QtCore.QTimer(self)
+        self.zoneRectsTimer.setSingleShot(True)
+        self.zoneRectsTimer.setInterval(0)
+        self.zoneRectsTimer.timeout.connect(self.RefreshZoneRects)
+
+        # dragging a comment moves it on every mouse move; only repack the
+        # comments once per event loop iteration
+        self.commentSaveTimer = QtCore.QTimer(self)
+        self.commentSaveTimer.setSingleShot(True)
+        self.commentSaveTimer.setInterval(0)
+        self.commentSaveTimer.timeout.connect(self.SaveComments)
+
         # done creating the window!
         self.setCentralWidget(self.view)
 
         # set up the clipboard stuff
         self.clipboard = None
+        self.lastClipboardText = None
         self.systemClipboard = QtWidgets.QApplication.clipboard()
         self.systemClipboard.dataChanged.connect(self.TrackClipboardUpdates)
 
         # we might have something there already, activate Paste if so
         self.TrackClipboardUpdates()
 
+        # created when the user is first asked to save their changes
+        self.dirtyMessageBox = None
+
     def __init2__(self):
         """
         Finishes initialization. (fixes bugs with some widgets calling globals_.mainWindow.something before it's init'ed)
         """
 
+        self.lastAutosaveData = None
+        self.lastAutosavePath = None
         self.AutosaveTimer = QtCore.QTimer()
         self.AutosaveTimer.timeout.connect(self.Autosave)
         self.AutosaveTimer.start(20000)
@@ -261,11 +304,10 @@ class ReggieWindow(QtWidgets.QMainWindow):
         # now get stuff ready
         loaded = False
 
-        if len(sys.argv) > 1 and os.path.isfile(sys.argv[1]) and IsNSMBLevel(sys.argv[1]):
+        if len(sys.argv) > 1 and IsNSMBLevel(sys.argv[1]):
             loaded = self.LoadLevel(None, sys.argv[1], True, 1)
-        elif globals_.settings.contains(('LastLevel_' + globals_.gamedef .name) if globals_.gamedef .custom else 'LastLevel'):
-            lastlevel = str(globals_.gamedef .GetLastLevel())
-            loaded = self.LoadLevel(None, lastlevel, True, 1)
+        elif globals_.LastLevel is not None:
+            loaded = self.LoadLevel(None, str(globals_.LastLevel), True, 1)
 
         if not loaded:
             self.LoadLevel(None, '01-01', False, 1)
@@ -310,361 +352,95 @@ class ReggieWindow(QtWidgets.QMainWindow):
 
     actions = {}
 
-    def createMenubar(self):
-        """
-        Create actions, a menubar and a toolbar
-        """
-
+    # (name, handler, icon, text string ID, status tip string ID, shortcut, toggleable)
+    # The strings are from the 'MenuItems' translation section. Show Overview
+    # and Show Palette are added later, as are the Help actions. The shortcuts
+    # are parsed once, when this class is created.
+    MenubarActions = (
         # File
-        self.CreateAction(
-            'newlevel', self.HandleNewLevel, GetIcon('new'),
-            globals_.trans.stringOneLine('MenuItems', 0), globals_.trans.stringOneLine('MenuItems', 1),
-            QtGui.QKeySequence.New,
-        )
-
-        self.CreateAction(
-            'openfromname', self.HandleOpenFromName, GetIcon('open'),
-            globals_.trans.stringOneLine('MenuItems', 2), globals_.trans.stringOneLine('MenuItems', 3),
-            QtGui.QKeySequence.Open,
-        )
-
-        self.CreateAction(
-            'openfromfile', self.HandleOpenFromFile, GetIcon('openfromfile'),
-            globals_.trans.stringOneLine('MenuItems', 4), globals_.trans.stringOneLine('MenuItems', 5),
-            QtGui.QKeySequence('Ctrl+Shift+O'),
-        )
-
-        self.CreateAction(
-            'openrecent', None, GetIcon('recent'),
-            globals_.trans.stringOneLine('MenuItems', 6), globals_.trans.stringOneLine('MenuItems', 7),
-            None,
-        )
-
-        self.CreateAction(
-            'save', self.HandleSave, GetIcon('save'),
-            globals_.trans.stringOneLine('MenuItems', 8), globals_.trans.stringOneLine('MenuItems', 9),
-            QtGui.QKeySequence.Save,
-        )
-
-        self.CreateAction(
-            'saveas', self.HandleSaveAs, GetIcon('saveas'),
-            globals_.trans.stringOneLine('MenuItems', 10), globals_.trans.stringOneLine('MenuItems', 11),
-            QtGui.QKeySequence.SaveAs,
-        )
-
-        self.CreateAction(
-            'savecopyas', self.HandleSaveCopyAs, GetIcon('savecopyas'),
-            globals_.trans.stringOneLine('MenuItems', 128), globals_.trans.stringOneLine('MenuItems', 129),
-            None,
-        )
-
-        self.CreateAction(
-            'metainfo', self.HandleInfo, GetIcon('info'),
-            globals_.trans.stringOneLine('MenuItems', 12), globals_.trans.stringOneLine('MenuItems', 13),
-            QtGui.QKeySequence('Ctrl+Alt+I'),
-        )
-
-        self.CreateAction(
-            'changegamedef', None, GetIcon('game'),
-            globals_.trans.stringOneLine('MenuItems', 98), globals_.trans.stringOneLine('MenuItems', 99),
-            None,
-        )
-
-        self.CreateAction(
-            'screenshot', self.HandleScreenshot, GetIcon('screenshot'),
-            globals_.trans.stringOneLine('MenuItems', 14), globals_.trans.stringOneLine('MenuItems', 15),
-            QtGui.QKeySequence('Ctrl+Alt+S'),
-        )
-
-        self.CreateAction(
-            'changegamepath', self.HandleChangeGamePath, GetIcon('folderpath'),
-            globals_.trans.stringOneLine('MenuItems', 16), globals_.trans.stringOneLine('MenuItems', 17),
-            QtGui.QKeySequence('Ctrl+Alt+G'),
-        )
-
-        self.CreateAction(
-            'preferences', self.HandlePreferences, GetIcon('settings'),
-            globals_.trans.stringOneLine('MenuItems', 18), globals_.trans.stringOneLine('MenuItems', 19),
-            QtGui.QKeySequence('Ctrl+Alt+P'),
-        )
-
-        self.CreateAction(
-            'exit', self.HandleExit, GetIcon('delete'),
-            globals_.trans.stringOneLine('MenuItems', 20), globals_.trans.stringOneLine('MenuItems', 21),
-            QtGui.QKeySequence('Ctrl+Q'),
-        )
-
+        ('newlevel', 'HandleNewLevel', 'new', 0, 1, QtGui.QKeySequence.New, False),
+        ('openfromname', 'HandleOpenFromName', 'open', 2, 3, QtGui.QKeySequence.Open, False),
+        ('openfromfile', 'HandleOpenFromFile', 'openfromfile', 4, 5, QtGui.QKeySequence('Ctrl+Shift+O'), False),
+        ('openrecent', None, 'recent', 6, 7, None, False),
+        ('save', 'HandleSave', 'save', 8, 9, QtGui.QKeySequence.Save, False),
+        ('saveas', 'HandleSaveAs', 'saveas', 10, 11, QtGui.QKeySequence.SaveAs, False),
+        ('savecopyas', 'HandleSaveCopyAs', 'savecopyas', 128, 129, None, False),
+        ('metainfo', 'HandleInfo', 'info', 12, 13, QtGui.QKeySequence('Ctrl+Alt+I'), False),
+        ('changegamedef', None, 'game', 98, 99, None, False),
+        ('screenshot', 'HandleScreenshot', 'screenshot', 14, 15, QtGui.QKeySequence('Ctrl+Alt+S'), False),
+        ('changegamepath', 'HandleChangeGamePath', 'folderpath', 16, 17, QtGui.QKeySequence('Ctrl+Alt+G'), False),
+        ('preferences', 'HandlePreferences', 'settings', 18, 19, QtGui.QKeySequence('Ctrl+Alt+P'), False),
+        ('exit', 'HandleExit', 'delete', 20, 21, QtGui.QKeySequence('Ctrl+Q'), False),
         # Edit
-        self.CreateAction(
-            'selectall', self.SelectAll, GetIcon('selectall'),
-            globals_.trans.stringOneLine('MenuItems', 22), globals_.trans.stringOneLine('MenuItems', 23),
-            QtGui.QKeySequence.SelectAll,
-        )
-
-        self.CreateAction(
-            'deselect', self.Deselect, GetIcon('deselect'),
-            globals_.trans.stringOneLine('MenuItems', 24), globals_.trans.stringOneLine('MenuItems', 25),
-            QtGui.QKeySequence('Ctrl+D'),
-        )
-
-        self.CreateAction(
-            'undo', self.Undo, GetIcon('undo'),
-            globals_.trans.stringOneLine('MenuItems', 124), globals_.trans.stringOneLine('MenuItems', 125),
-            QtGui.QKeySequence.Undo,
-        )
-
-        self.CreateAction(
-            'redo', self.Redo, GetIcon('redo'),
-            globals_.trans.stringOneLine('MenuItems', 126), globals_.trans.stringOneLine('MenuItems', 127),
-            QtGui.QKeySequence.Redo,
-        )
-
-        self.CreateAction(
-            'cut', self.Cut, GetIcon('cut'),
-            globals_.trans.stringOneLine('MenuItems', 26), globals_.trans.stringOneLine('MenuItems', 27),
-            QtGui.QKeySequence.Cut,
-        )
-
-        self.CreateAction(
-            'copy', self.Copy, GetIcon('copy'),
-            globals_.trans.stringOneLine('MenuItems', 28), globals_.trans.stringOneLine('MenuItems', 29),
-            QtGui.QKeySequence.Copy,
-        )
-
-        self.CreateAction(
-            'paste', self.Paste, GetIcon('paste'),
-            globals_.trans.stringOneLine('MenuItems', 30), globals_.trans.stringOneLine('MenuItems', 31),
-            QtGui.QKeySequence.Paste,
-        )
-
-        self.CreateAction(
-            'shiftitems', self.ShiftItems, GetIcon('move'),
-            globals_.trans.stringOneLine('MenuItems', 32), globals_.trans.stringOneLine('MenuItems', 33),
-            QtGui.QKeySequence('Ctrl+Shift+S'),
-        )
-
-        self.CreateAction(
-            'mergelocations', self.MergeLocations, GetIcon('merge'),
-            globals_.trans.stringOneLine('MenuItems', 34), globals_.trans.stringOneLine('MenuItems', 35),
-            QtGui.QKeySequence('Ctrl+Shift+E'),
-        )
-
-        self.CreateAction(
-            'swapobjectstilesets', self.SwapObjectsTilesets, GetIcon('swap'),
-            globals_.trans.stringOneLine('MenuItems', 104), globals_.trans.stringOneLine('MenuItems', 105),
-            QtGui.QKeySequence('Ctrl+Shift+L'),
-        )
-
-        self.CreateAction(
-            'swapobjectstypes', self.SwapObjectsTypes, GetIcon('swap'),
-            globals_.trans.stringOneLine('MenuItems', 106), globals_.trans.stringOneLine('MenuItems', 107),
-            QtGui.QKeySequence('Ctrl+Shift+Y'),
-        )
-
-        self.CreateAction(
-            'diagnostic', self.HandleDiagnostics, GetIcon('diagnostics'),
-            globals_.trans.stringOneLine('MenuItems', 36), globals_.trans.stringOneLine('MenuItems', 37),
-            QtGui.QKeySequence('Ctrl+Shift+D'),
-        )
-
-        self.CreateAction(
-            'freezeobjects', self.HandleObjectsFreeze, GetIcon('objectsfreeze'),
-            globals_.trans.stringOneLine('MenuItems', 38), globals_.trans.stringOneLine('MenuItems', 39),
-            QtGui.QKeySequence('Ctrl+Shift+1'), True,
-        )
-
-        self.CreateAction(
-            'freezesprites', self.HandleSpritesFreeze, GetIcon('spritesfreeze'),
-            globals_.trans.stringOneLine('MenuItems', 40), globals_.trans.stringOneLine('MenuItems', 41),
-            QtGui.QKeySequence('Ctrl+Shift+2'), True,
-        )
-
-        self.CreateAction(
-            'freezeentrances', self.HandleEntrancesFreeze, GetIcon('entrancesfreeze'),
-            globals_.trans.stringOneLine('MenuItems', 42), globals_.trans.stringOneLine('MenuItems', 43),
-            QtGui.QKeySequence('Ctrl+Shift+3'), True,
-        )
-
-        self.CreateAction(
-            'freezelocations', self.HandleLocationsFreeze, GetIcon('locationsfreeze'),
-            globals_.trans.stringOneLine('MenuItems', 44), globals_.trans.stringOneLine('MenuItems', 45),
-            QtGui.QKeySequence('Ctrl+Shift+4'), True,
-        )
-
-        self.CreateAction(
-            'freezepaths', self.HandlePathsFreeze, GetIcon('pathsfreeze'),
-            globals_.trans.stringOneLine('MenuItems', 46), globals_.trans.stringOneLine('MenuItems', 47),
-            QtGui.QKeySequence('Ctrl+Shift+5'), True,
-        )
-
-        self.CreateAction(
-            'freezecomments', self.HandleCommentsFreeze, GetIcon('commentsfreeze'),
-            globals_.trans.stringOneLine('MenuItems', 114), globals_.trans.stringOneLine('MenuItems', 115),
-            QtGui.QKeySequence('Ctrl+Shift+9'), True,
-        )
-
+        ('selectall', 'SelectAll', 'selectall', 22, 23, QtGui.QKeySequence.SelectAll, False),
+        ('deselect', 'Deselect', 'deselect', 24, 25, QtGui.QKeySequence('Ctrl+D'), False),
+        ('undo', 'Undo', 'undo', 124, 125, QtGui.QKeySequence.Undo, False),
+        ('redo', 'Redo', 'redo', 126, 127, QtGui.QKeySequence.Redo, False),
+        ('cut', 'Cut', 'cut', 26, 27, QtGui.QKeySequence.Cut, False),
+        ('copy', 'Copy', 'copy', 28, 29, QtGui.QKeySequence.Copy, False),
+        ('paste', 'Paste', 'paste', 30, 31, QtGui.QKeySequence.Paste, False),
+        ('shiftitems', 'ShiftItems', 'move', 32, 33, QtGui.QKeySequence('Ctrl+Shift+S'), False),
+        ('mergelocations', 'MergeLocations', 'merge', 34, 35, QtGui.QKeySequence('Ctrl+Shift+E'), False),
+        ('swapobjectstilesets', 'SwapObjectsTilesets', 'swap', 104, 105, QtGui.QKeySequence('Ctrl+Shift+L'), False),
+        ('swapobjectstypes', 'SwapObjectsTypes', 'swap', 106, 107, QtGui.QKeySequence('Ctrl+Shift+Y'), False),
+        ('diagnostic', 'HandleDiagnostics', 'diagnostics', 36, 37, QtGui.QKeySequence('Ctrl+Shift+D'), False),
+        ('freezeobjects', 'HandleObjectsFreeze', 'objectsfreeze', 38, 39, QtGui.QKeySequence('Ctrl+Shift+1'), True),
+        ('freezesprites', 'HandleSpritesFreeze', 'spritesfreeze', 40, 41, QtGui.QKeySequence('Ctrl+Shift+2'), True),
+        ('freezeentrances', 'HandleEntrancesFreeze', 'entrancesfreeze', 42, 43, QtGui.QKeySequence('Ctrl+Shift+3'), True),
+        ('freezelocations', 'HandleLocationsFreeze', 'locationsfreeze', 44, 45, QtGui.QKeySequence('Ctrl+Shift+4'), True),
+        ('freezepaths', 'HandlePathsFreeze', 'pathsfreeze', 46, 47, QtGui.QKeySequence('Ctrl+Shift+5'), True),
+        ('freezecomments', 'HandleCommentsFreeze', 'commentsfreeze', 114, 115, QtGui.QKeySequence('Ctrl+Shift+9'), True),
         # View
-        self.CreateAction(
-            'showlay0', self.HandleUpdateLayer0, GetIcon('layer0'),
-            globals_.trans.stringOneLine('MenuItems', 48), globals_.trans.stringOneLine('MenuItems', 49),
-            QtGui.QKeySequence('Ctrl+1'), True,
-        )
-
-        self.CreateAction(
-            'showlay1', self.HandleUpdateLayer1, GetIcon('layer1'),
-            globals_.trans.stringOneLine('MenuItems', 50), globals_.trans.stringOneLine('MenuItems', 51),
-            QtGui.QKeySequence('Ctrl+2'), True,
-        )
-
-        self.CreateAction(
-            'showlay2', self.HandleUpdateLayer2, GetIcon('layer2'),
-            globals_.trans.stringOneLine('MenuItems', 52), globals_.trans.stringOneLine('MenuItems', 53),
-            QtGui.QKeySequence('Ctrl+3'), True,
-        )
-
-        self.CreateAction(
-            'tileanim', self.HandleTilesetAnimToggle, GetIcon('animation'),
-            globals_.trans.stringOneLine('MenuItems', 108), globals_.trans.stringOneLine('MenuItems', 109),
-            QtGui.QKeySequence('Ctrl+7'), True,
-        )
-
-        self.CreateAction(
-            'collisions', self.HandleCollisionsToggle, GetIcon('collisions'),
-            globals_.trans.stringOneLine('MenuItems', 110), globals_.trans.stringOneLine('MenuItems', 111),
-            QtGui.QKeySequence('Ctrl+8'), True,
-        )
-
-        self.CreateAction(
-            'realview', self.HandleRealViewToggle, GetIcon('realview'),
-            globals_.trans.stringOneLine('MenuItems', 118), globals_.trans.stringOneLine('MenuItems', 119),
-            QtGui.QKeySequence('Ctrl+9'), True,
-        )
-
-        self.CreateAction(
-            'showsprites', self.HandleSpritesVisibility, GetIcon('sprites'),
-            globals_.trans.stringOneLine('MenuItems', 54), globals_.trans.stringOneLine('MenuItems', 55),
-            QtGui.QKeySequence('Ctrl+4'), True,
-        )
-
-        self.CreateAction(
-            'showspriteimages', self.HandleSpriteImages, GetIcon('sprites'),
-            globals_.trans.stringOneLine('MenuItems', 56), globals_.trans.stringOneLine('MenuItems', 57),
-            QtGui.QKeySequence('Ctrl+6'), True,
-        )
-
-        self.CreateAction(
-            'showlocations', self.HandleLocationsVisibility, GetIcon('locations'),
-            globals_.trans.stringOneLine('MenuItems', 58), globals_.trans.stringOneLine('MenuItems', 59),
-            QtGui.QKeySequence('Ctrl+5'), True,
-        )
-
-        self.CreateAction(
-            'showcomments', self.HandleCommentsVisibility, GetIcon('comments'),
-            globals_.trans.stringOneLine('MenuItems', 116), globals_.trans.stringOneLine('MenuItems', 117),
-            QtGui.QKeySequence('Ctrl+0'), True,
-        )
-
-        self.CreateAction(
-            'showpaths', self.HandlePathsVisibility, GetIcon('paths'),
-            globals_.trans.stringOneLine('MenuItems', 130), globals_.trans.stringOneLine('MenuItems', 131),
-            QtGui.QKeySequence('Ctrl+*'), True,
-        )
-
-        self.CreateAction(
-            'grid', self.HandleSwitchGrid, GetIcon('grid'),
-            globals_.trans.stringOneLine('MenuItems', 60), globals_.trans.stringOneLine('MenuItems', 61),
-            QtGui.QKeySequence('Ctrl+G'),
-        )
-
-        self.CreateAction(
-            'zoommax', self.HandleZoomMax, GetIcon('zoommax'),
-            globals_.trans.stringOneLine('MenuItems', 62), globals_.trans.stringOneLine('MenuItems', 63),
-            QtGui.QKeySequence('Ctrl+PgDown'),
-        )
-
-        self.CreateAction(
-            'zoomin', self.HandleZoomIn, GetIcon('zoomin'),
-            globals_.trans.stringOneLine('MenuItems', 64), globals_.trans.stringOneLine('MenuItems', 65),
-            QtGui.QKeySequence.ZoomIn,
-        )
-
-        self.CreateAction(
-            'zoomactual', self.HandleZoomActual, GetIcon('zoomactual'),
-            globals_.trans.stringOneLine('MenuItems', 66), globals_.trans.stringOneLine('MenuItems', 67),
-            QtGui.QKeySequence('Ctrl+0'),
-        )
-
-        self.CreateAction(
-            'zoomout', self.HandleZoomOut, GetIcon('zoomout'),
-            globals_.trans.stringOneLine('MenuItems', 68), globals_.trans.stringOneLine('MenuItems', 69),
-            QtGui.QKeySequence.ZoomOut,
-        )
-
-        self.CreateAction(
-            'zoommin', self.HandleZoomMin, GetIcon('zoommin'),
-            globals_.trans.stringOneLine('MenuItems', 70), globals_.trans.stringOneLine('MenuItems', 71),
-            QtGui.QKeySequence('Ctrl+PgUp'),
-        )
-
-        # Show Overview and Show Palette are added later
-
+        ('showlay0', 'HandleUpdateLayer0', 'layer0', 48, 49, QtGui.QKeySequence('Ctrl+1'), True),
+        ('showlay1', 'HandleUpdateLayer1', 'layer1', 50, 51, QtGui.QKeySequence('Ctrl+2'), True),
+        ('showlay2', 'HandleUpdateLayer2', 'layer2', 52, 53, QtGui.QKeySequence('Ctrl+3'), True),
+        ('tileanim', 'HandleTilesetAnimToggle', 'animation', 108, 109, QtGui.QKeySequence('Ctrl+7'), True),
+        ('collisions', 'HandleCollisionsToggle', 'collisions', 110, 111, QtGui.QKeySequence('Ctrl+8'), True),
+        ('realview', 'HandleRealViewToggle', 'realview', 118, 119, QtGui.QKeySequence('Ctrl+9'), True),
+        ('showsprites', 'HandleSpritesVisibility', 'sprites', 54, 55, QtGui.QKeySequence('Ctrl+4'), True),
+        ('showspriteimages', 'HandleSpriteImages', 'sprites', 56, 57, QtGui.QKeySequence('Ctrl+6'), True),
+        ('showlocations', 'HandleLocationsVisibility', 'locations', 58, 59, QtGui.QKeySequence('Ctrl+5'), True),
+        ('showcomments', 'HandleCommentsVisibility', 'comments', 116, 117, QtGui.QKeySequence('Ctrl+0'), True),
+        ('showpaths', 'HandlePathsVisibility', 'paths', 130, 131, QtGui.QKeySequence('Ctrl+*'), True),
+        ('grid', 'HandleSwitchGrid', 'grid', 60, 61, QtGui.QKeySequence('Ctrl+G'), False),
+        ('zoommax', 'HandleZoomMax', 'zoommax', 62, 63, QtGui.QKeySequence('Ctrl+PgDown'), False),
+        ('zoomin', 'HandleZoomIn', 'zoomin', 64, 65, QtGui.QKeySequence.ZoomIn, False),
+        ('zoomactual', 'HandleZoomActual', 'zoomactual', 66, 67, QtGui.QKeySequence('Ctrl+0'), False),
+        ('zoomout', 'HandleZoomOut', 'zoomout', 68, 69, QtGui.QKeySequence.ZoomOut, False),
+        ('zoommin', 'HandleZoomMin', 'zoommin', 70, 71, QtGui.QKeySequence('Ctrl+PgUp'), False),
         # Settings
-        self.CreateAction(
-            'areaoptions', self.HandleAreaOptions, GetIcon('area'),
-            globals_.trans.stringOneLine('MenuItems', 72), globals_.trans.stringOneLine('MenuItems', 73),
-            QtGui.QKeySequence('Ctrl+Alt+A'),
-        )
-
-        self.CreateAction(
-            'zones', self.HandleZones, GetIcon('zones'),
-            globals_.trans.stringOneLine('MenuItems', 74), globals_.trans.stringOneLine('MenuItems', 75),
-            QtGui.QKeySequence('Ctrl+Alt+Z'),
-        )
-
-        self.CreateAction(
-            'backgrounds', self.HandleBG, GetIcon('background'),
-            globals_.trans.stringOneLine('MenuItems', 76), globals_.trans.stringOneLine('MenuItems', 77),
-            QtGui.QKeySequence('Ctrl+Alt+B'),
-        )
-
-        self.CreateAction(
-            'addarea', self.HandleAddNewArea, GetIcon('add'),
-            globals_.trans.stringOneLine('MenuItems', 78), globals_.trans.stringOneLine('MenuItems', 79),
-            QtGui.QKeySequence('Ctrl+Alt+N'),
-        )
-
-        self.CreateAction(
-            'importarea', self.HandleImportArea, GetIcon('import'),
-            globals_.trans.stringOneLine('MenuItems', 80), globals_.trans.stringOneLine('MenuItems', 81),
-            QtGui.QKeySequence('Ctrl+Alt+O'),
-        )
+        ('areaoptions', 'HandleAreaOptions', 'area', 72, 73, QtGui.QKeySequence('Ctrl+Alt+A'), False),
+        ('zones', 'HandleZones', 'zones', 74, 75, QtGui.QKeySequence('Ctrl+Alt+Z'), False),
+        ('backgrounds', 'HandleBG', 'background', 76, 77, QtGui.QKeySequence('Ctrl+Alt+B'), False),
+        ('addarea', 'HandleAddNewArea', 'add', 78, 79, QtGui.QKeySequence('Ctrl+Alt+N'), False),
+        ('importarea', 'HandleImportArea', 'import', 80, 81, QtGui.QKeySequence('Ctrl+Alt+O'), False),
+        ('deletearea', 'HandleDeleteArea', 'delete', 82, 83, QtGui.QKeySequence('Ctrl+Alt+D'), False),
+        ('openpuzzle', 'OpenPuzzle', 'reload-tilesets', 140, 141, None, False),
+        ('reloadgfx', 'ReloadTilesets', 'reload-tilesets', 84, 85, QtGui.QKeySequence('Ctrl+Shift+R'), False),
+        ('reloaddata', 'ReloadSpritedata', 'reload-spritedata', 138, 139, None, False),
+    )
+
+    # Shortcuts of the actions that are not created from MenubarActions
+    OtherShortcuts = {
+        'infobox': QtGui.QKeySequence('Ctrl+Shift+I'),
+        'helpbox': QtGui.QKeySequence('Ctrl+Shift+H'),
+        'tipbox': QtGui.QKeySequence('Ctrl+Shift+T'),
+        'aboutqt': QtGui.QKeySequence('Ctrl+Shift+Q'),
+        'leveloverview': QtGui.QKeySequence('Ctrl+M'),
+        'palette': QtGui.QKeySequence('Ctrl+P'),
+    }
 
-        self.CreateAction(
-            'deletearea', self.HandleDeleteArea, GetIcon('delete'),
-            globals_.trans.stringOneLine('MenuItems', 82), globals_.trans.stringOneLine('MenuItems', 83),
-            QtGui.QKeySequence('Ctrl+Alt+D'),
-        )
-
-        self.CreateAction(
-            'openpuzzle', self.OpenPuzzle, GetIcon('reload-tilesets'),
-            globals_.trans.stringOneLine('MenuItems', 140), globals_.trans.stringOneLine('MenuItems', 141),
-            None
-        )
-
-        self.CreateAction(
-            'reloadgfx', self.ReloadTilesets, GetIcon('reload-tilesets'),
-            globals_.trans.stringOneLine('MenuItems', 84), globals_.trans.stringOneLine('MenuItems', 85),
-            QtGui.QKeySequence('Ctrl+Shift+R'),
-        )
-
-        self.CreateAction(
-            'reloaddata', self.ReloadSpritedata, GetIcon('reload-spritedata'),
-            globals_.trans.stringOneLine('MenuItems', 138), globals_.trans.stringOneLine('MenuItems', 139),
-            # No shortcut for now...
-            None
-        )
+    def createMenubar(self):
+        """
+        Create actions, a menubar and a toolbar
+        """
 
-        # Help actions are created later
+        for name, function, icon, text, statustext, shortcut, toggle in self.MenubarActions:
+            self.CreateAction(
+                name, None if function is None else getattr(self, function), GetIcon(icon),
+                globals_.trans.stringOneLine('MenuItems', text), globals_.trans.stringOneLine('MenuItems', statustext),
+                shortcut, toggle,
+            )
 
         # Configure them
         self.actions['openrecent'].setMenu(self.RecentMenu)
@@ -800,14 +576,16 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         Creates the help menu.
         """
-        self.CreateAction('infobox', self.AboutBox, GetIcon('reggie'), globals_.trans.stringOneLine('MenuItems', 86),
-                          globals_.trans.string('MenuItems', 87), QtGui.QKeySequence('Ctrl+Shift+I'))
-        self.CreateAction('helpbox', self.HelpBox, GetIcon('contents'), globals_.trans.stringOneLine('MenuItems', 88),
-                          globals_.trans.string('MenuItems', 89), QtGui.QKeySequence('Ctrl+Shift+H'))
-        self.CreateAction('tipbox', self.TipBox, GetIcon('tips'), globals_.trans.stringOneLine('MenuItems', 90),
-                          globals_.trans.string('MenuItems', 91), QtGui.QKeySequence('Ctrl+Shift+T'))
-        self.CreateAction('aboutqt', QtWidgets.qApp.aboutQt, GetIcon('qt'), globals_.trans.stringOneLine('MenuItems', 92),
-                          globals_.trans.string('MenuItems', 93), QtGui.QKeySequence('Ctrl+Shift+Q'))
+        # the actions are shared by every help menu, so only create them once
+        if 'infobox' not in self.actions:
+            self.CreateAction('infobox', self.AboutBox, GetIcon('reggie'), globals_.trans.stringOneLine('MenuItems', 86),
+                              globals_.trans.string('MenuItems', 87), self.OtherShortcuts['infobox'])
+            self.CreateAction('helpbox', self.HelpBox, GetIcon('contents'), globals_.trans.stringOneLine('MenuItems', 88),
+                              globals_.trans.string('MenuItems', 89), self.OtherShortcuts['helpbox'])
+            self.CreateAction('tipbox', self.TipBox, GetIcon('tips'), globals_.trans.stringOneLine('MenuItems', 90),
+                              globals_.trans.string('MenuItems', 91), self.OtherShortcuts['tipbox'])
+            self.CreateAction('aboutqt', QtWidgets.qApp.aboutQt, GetIcon('qt'), globals_.trans.stringOneLine('MenuItems', 92),
+                              globals_.trans.string('MenuItems', 93), self.OtherShortcuts['aboutqt'])
 
         if menu is None:
             menu = QtWidgets.QMenu(globals_.trans.string('Menubar', 4))
@@ -818,110 +596,130 @@ class ReggieWindow(QtWidgets.QMainWindow):
         menu.addAction(self.actions['aboutqt'])
         return menu
 
+    # Actions that can be added to the toolbar. Each group is isolated by
+    # separators.
+    ToolbarGroups = (
+        (
+            'newlevel',
+            'openfromname',
+            'openfromfile',
+            'openrecent',
+            'save',
+            'saveas',
+            'savecopyas',
+            'metainfo',
+            'screenshot',
+            'changegamepath',
+            'preferences',
+            'exit',
+        ), (
+            'selectall',
+            'deselect',
+        ), (
+            'cut',
+            'copy',
+            'paste',
+        ), (
+            'shiftitems',
+            'mergelocations',
+        ), (
+            'freezeobjects',
+            'freezesprites',
+            'freezeentrances',
+            'freezelocations',
+            'freezepaths',
+        ), (
+            'diagnostic',
+        ), (
+            'zoommax',
+            'zoomin',
+            'zoomactual',
+            'zoomout',
+            'zoommin',
+        ), (
+            'grid',
+        ), (
+            'showlay0',
+            'showlay1',
+            'showlay2',
+        ), (
+            'showsprites',
+            'showspriteimages',
+            'showlocations',
+            'showpaths',
+        ), (
+            'areaoptions',
+            'zones',
+            'backgrounds',
+        ), (
+            'addarea',
+            'importarea',
+            'deletearea',
+        ), (
+            'openpuzzle',
+            'reloadgfx',
+            'reloaddata',
+        ), (
+            'infobox',
+            'helpbox',
+            'tipbox',
+            'aboutqt',
+        ),
+    )
+
     def addToolbarButtons(self):
         """
         Reads from the Preferences file and adds the appropriate options to the toolbar
         """
-        # First, define groups. Each group is isolated by separators.
-        Groups = (
-            (
-                'newlevel',
-                'openfromname',
-                'openfromfile',
-                'openrecent',
-                'save',
-                'saveas',
-                'savecopyas',
-                'metainfo',
-                'screenshot',
-                'changegamepath',
-                'preferences',
-                'exit',
-            ), (
-                'selectall',
-                'deselect',
-            ), (
-                'cut',
-                'copy',
-                'paste',
-            ), (
-                'shiftitems',
-                'mergelocations',
-            ), (
-                'freezeobjects',
-                'freezesprites',
-                'freezeentrances',
-                'freezelocations',
-                'freezepaths',
-            ), (
-                'diagnostic',
-            ), (
-                'zoommax',
-                'zoomin',
-                'zoomactual',
-                'zoomout',
-                'zoommin',
-            ), (
-                'grid',
-            ), (
-                'showlay0',
-                'showlay1',
-                'showlay2',
-            ), (
-                'showsprites',
-                'showspriteimages',
-                'showlocations',
-                'showpaths',
-            ), (
-                'areaoptions',
-                'zones',
-                'backgrounds',
-            ), (
-                'addarea',
-                'importarea',
-                'deletearea',
-            ), (
-                'openpuzzle',
-                'reloadgfx',
-                'reloaddata',
-            ), (
-                'infobox',
-                'helpbox',
-                'tipbox',
-                'aboutqt',
-            ),
-        )
+        toggled = GetToolbarActs()
 
-        # Determine which keys are activated
-        if setting('ToolbarActs') in (None, 'None', 'none', '', 0):
-            # Get the default settings
-            toggled = {}
-            for List in (globals_.FileActions, globals_.EditActions, globals_.ViewActions, globals_.SettingsActions, globals_.HelpActions):
-                for name, activated, key in List:
-                    toggled[key] = activated
-        else:
-            # Get the settings from the .ini
-            toggled = setting('ToolbarActs')
-            newToggled = {}  # here, I'm replacing QStrings with python strings
-            for key in toggled:
-                newToggled[str(key)] = toggled[key]
-            toggled = newToggled
-
-        # Add each to the toolbar if toggled[key]
-        for group in Groups:
-            addedButtons = False
-            for key in group:
-                if key in toggled and toggled[key]:
-                    act = self.actions[key]
-                    self.toolbar.addAction(act)
-                    addedButtons = True
-            if addedButtons:
+        # Add each group's toggled actions to the toolbar at once
+        acts = self.actions
+        for group in self.ToolbarGroups:
+            groupActs = [acts[key] for key in group if toggled.get(key)]
+            if groupActs:
+                self.toolbar.addActions(groupActs)
                 self.toolbar.addSeparator()
 
+    # The editor panels are only created once they are first needed
+    spriteDataEditor = property(lambda self: self.spriteEditorDock.contents())
+    entranceEditor = property(lambda self: self.entranceEditorDock.contents())
+    pathEditor = property(lambda self: self.pathEditorDock.contents())
+    locationEditor = property(lambda self: self.locationEditorDock.contents())
+    defaultDataEditor = property(lambda self: self.defaultPropDock.contents())
+
+    def CreateSpriteDataEditor(self):
+        """
+        Creates the sprite data editor panel
+        """
+        editor = SpriteEditorWidget()
+        editor.DataUpdate.connect(self.SpriteDataUpdated)
+        return editor
+
+    def CreateDefaultDataEditor(self):
+        """
+        Creates the default sprite data editor panel
+        """
+        editor = SpriteEditorWidget(True)
+        editor.setVisible(False)
+        return editor
+
     def SetupDocksAndPanels(self):
         """
         Sets up the dock widgets and panels
         """
+        # relayout the window once at the end, rather than after every dock,
+        # tab and widget that is added
+        self.setUpdatesEnabled(False)
+        try:
+            self.CreateDocksAndPanels()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def CreateDocksAndPanels(self):
+        """
+        Creates the dock widgets and panels
+        """
         # level overview
         dock = QtWidgets.QDockWidget(globals_.trans.string('MenuItems', 94), self)
         dock.setFeatures(
@@ -931,73 +729,71 @@ class ReggieWindow(QtWidgets.QMainWindow):
 
         self.levelOverview = LevelOverviewWidget()
         self.levelOverview.moveIt.connect(self.HandleOverviewClick)
+
+        # scrolling and resizing both move the position box, so only repaint
+        # the overview once per event loop iteration
+        self.overviewUpdateTimer = QtCore.QTimer(self)
+        self.overviewUpdateTimer.setSingleShot(True)
+        self.overviewUpdateTimer.setInterval(0)
+        self.overviewUpdateTimer.timeout.connect(self.levelOverview.update)
         self.levelOverviewDock = dock
         dock.setWidget(self.levelOverview)
 
         self.addDockWidget(Qt.RightDockWidgetArea, dock)
         dock.setVisible(True)
         act = dock.toggleViewAction()
-        act.setShortcut(QtGui.QKeySequence('Ctrl+M'))
+        act.setShortcut(self.OtherShortcuts['leveloverview'])
         act.setIcon(GetIcon('overview'))
         act.setStatusTip(globals_.trans.string('MenuItems', 95))
         self.vmenu.addAction(act)
 
         # create the sprite editor panel
-        dock = QtWidgets.QDockWidget(globals_.trans.string('SpriteDataEditor', 0), self)
+        dock = LazyDockWidget(globals_.trans.string('SpriteDataEditor', 0), self, self.CreateSpriteDataEditor)
         dock.setVisible(False)
         dock.setFeatures(QtWidgets.QDockWidget.DockWidgetMovable | QtWidgets.QDockWidget.DockWidgetFloatable)
         dock.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
         dock.setObjectName('spriteeditor')  # needed for the state to save/restore correctly
         dock.move(100, 100) # offset the dock from the top-left corner
 
-        self.spriteDataEditor = SpriteEditorWidget()
-        self.spriteDataEditor.DataUpdate.connect(self.SpriteDataUpdated)
-        dock.setWidget(self.spriteDataEditor)
         self.spriteEditorDock = dock
 
         self.addDockWidget(Qt.RightDockWidgetArea, dock)
         dock.setFloating(True)
 
         # create the entrance editor panel
-        dock = QtWidgets.QDockWidget(globals_.trans.string('EntranceDataEditor', 24), self)
+        dock = LazyDockWidget(globals_.trans.string('EntranceDataEditor', 24), self, EntranceEditorWidget)
         dock.setVisible(False)
         dock.setFeatures(QtWidgets.QDockWidget.DockWidgetMovable | QtWidgets.QDockWidget.DockWidgetFloatable)
         dock.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
         dock.setObjectName('entranceeditor')  # needed for the state to save/restore correctly
         dock.move(100, 100) # offset the dock from the top-left corner
 
-        self.entranceEditor = EntranceEditorWidget()
-        dock.setWidget(self.entranceEditor)
         self.entranceEditorDock = dock
 
         self.addDockWidget(Qt.RightDockWidgetArea, dock)
         dock.setFloating(True)
 
         # create the path node editor panel
-        dock = QtWidgets.QDockWidget(globals_.trans.string('PathDataEditor', 10), self)
+        dock = LazyDockWidget(globals_.trans.string('PathDataEditor', 10), self, PathNodeEditorWidget)
         dock.setVisible(False)
         dock.setFeatures(QtWidgets.QDockWidget.DockWidgetMovable | QtWidgets.QDockWidget.DockWidgetFloatable)
         dock.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
         dock.setObjectName('pathnodeeditor')  # needed for the state to save/restore correctly
         dock.move(100, 100) # offset the dock from the top-left corner
 
-        self.pathEditor = PathNodeEditorWidget()
-        dock.setWidget(self.pathEditor)
         self.pathEditorDock = dock
 
         self.addDockWidget(Qt.RightDockWidgetArea, dock)
         dock.setFloating(True)
 
         # create the location editor panel
-        dock = QtWidgets.QDockWidget(globals_.trans.string('LocationDataEditor', 12), self)
+        dock = LazyDockWidget(globals_.trans.string('LocationDataEditor', 12), self, LocationEditorWidget)
         dock.setVisible(False)
         dock.setFeatures(QtWidgets.QDockWidget.DockWidgetMovable | QtWidgets.QDockWidget.DockWidgetFloatable)
         dock.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
         dock.setObjectName('locationeditor')  # needed for the state to save/restore correctly
         dock.move(100, 100) # offset the dock from the top-left corner
 
-        self.locationEditor = LocationEditorWidget()
-        dock.setWidget(self.locationEditor)
         self.locationEditorDock = dock
 
         self.addDockWidget(Qt.RightDockWidgetArea, dock)
@@ -1012,7 +808,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
 
         self.creationDock = dock
         act = dock.toggleViewAction()
-        act.setShortcut(QtGui.QKeySequence('Ctrl+P'))
+        act.setShortcut(self.OtherShortcuts['palette'])
         act.setIcon(GetIcon('palette'))
         act.setStatusTip(globals_.trans.string('MenuItems', 97))
         self.vmenu.addAction(act)
@@ -1024,6 +820,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         tabs = QtWidgets.QTabWidget()
         tabs.setIconSize(QtCore.QSize(16, 16))
         tabs.currentChanged.connect(self.CreationTabChanged)
+        tabs.blockSignals(True)  # the current tab is handled once all tabs are added
         dock.setWidget(tabs)
         self.creationTabs = tabs
 
@@ -1044,6 +841,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         self.objAllTab.addTab(self.objTS1Tab, tsicon, '2')
         self.objAllTab.addTab(self.objTS2Tab, tsicon, '3')
         self.objAllTab.addTab(self.objTS3Tab, tsicon, '4')
+        self.objTSTabs = (self.objTS0Tab, self.objTS1Tab, self.objTS2Tab, self.objTS3Tab)
 
         oel = QtWidgets.QVBoxLayout(self.objTS0Tab)
         self.createObjectLayout = oel
@@ -1093,10 +891,9 @@ class ReggieWindow(QtWidgets.QMainWindow):
         sspl = QtWidgets.QHBoxLayout()
         sspl.addWidget(QtWidgets.QLabel(globals_.trans.string('Palette', 5)))
 
-        LoadSpriteCategories()
+        # the views are added by LoadSpritePicker when the sprite palette is
+        # first shown
         viewpicker = QtWidgets.QComboBox()
-        for view in globals_.SpriteCategories:
-            viewpicker.addItem(view[0])
         viewpicker.currentIndexChanged.connect(self.SelectNewSpriteView)
 
         self.spriteViewPicker = viewpicker
@@ -1116,7 +913,6 @@ class ReggieWindow(QtWidgets.QMainWindow):
         self.sprPicker = SpritePickerWidget()
         self.sprPicker.SpriteChanged.connect(self.SpriteChoiceChanged)
         self.sprPicker.SpriteReplace.connect(self.SpriteReplace)
-        self.sprPicker.SwitchView(globals_.SpriteCategories[0])
         spl.addWidget(self.sprPicker, 1)
 
         self.defaultPropButton = QtWidgets.QPushButton(globals_.trans.string('Palette', 6))
@@ -1130,17 +926,13 @@ class ReggieWindow(QtWidgets.QMainWindow):
         spl.addLayout(sdpl)
 
         # default sprite data editor
-        ddock = QtWidgets.QDockWidget(globals_.trans.string('Palette', 7), self)
+        ddock = LazyDockWidget(globals_.trans.string('Palette', 7), self, self.CreateDefaultDataEditor)
         ddock.setFeatures(
             QtWidgets.QDockWidget.DockWidgetMovable | QtWidgets.QDockWidget.DockWidgetFloatable | QtWidgets.QDockWidget.DockWidgetClosable)
         ddock.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
         ddock.setObjectName('defaultprops')  # needed for the state to save/restore correctly
         ddock.move(100, 100) # offset the dock from the top-left corner
 
-        self.defaultDataEditor = SpriteEditorWidget(True)
-        self.defaultDataEditor.setVisible(False)
-        ddock.setWidget(self.defaultDataEditor)
-
         self.addDockWidget(Qt.RightDockWidgetArea, ddock)
         ddock.setVisible(False)
         ddock.setFloating(True)
@@ -1244,25 +1036,59 @@ class ReggieWindow(QtWidgets.QMainWindow):
             itm.setCheckState(0, Qt.Unchecked)
             itm.setText(0, globals_.trans.string('Palette', 24, '[id]', str(id + 1)))
             itm.setText(1, '')
-            self.eventChooser.addTopLevelItem(itm)
+            itm.setData(0, Qt.UserRole, id)
             self.eventChooserItems.append(itm)
-            if id == 0: itm.setSelected(True)
+
+        # add all items at once, so the view only updates once
+        self.eventChooser.addTopLevelItems(self.eventChooserItems)
+        self.eventChooserItems[0].setSelected(True)
 
         eventel.addWidget(eventlabel, 0, 0, 1, 2)
         eventel.addWidget(eventNotesLabel, 1, 0)
         eventel.addWidget(self.eventNotesEditor, 1, 1)
         eventel.addWidget(self.eventChooser, 2, 0, 1, 2)
 
-        # stamps tab
+        # stamps tab, filled in by CreateStampsTab when it is first shown
         self.stampTab = QtWidgets.QWidget()
         tabs.addTab(self.stampTab, GetIcon('stamp'), '')
         tabs.setTabToolTip(6, globals_.trans.string('Palette', 19))
 
+        self.stampAddBtn = None
+        self.creationTabBuilders = {6: self.CreateStampsTab}
+
+        # comments tab
+        self.commentsTab = QtWidgets.QWidget()
+        tabs.addTab(self.commentsTab, GetIcon('comments'), '')
+        tabs.setTabToolTip(7, globals_.trans.string('Palette', 33))
+
+        cel = QtWidgets.QVBoxLayout()
+        self.commentsTab.setLayout(cel)
+        self.entEditorLayout = cel
+
+        clabel = QtWidgets.QLabel(globals_.trans.string('Palette', 34))
+        clabel.setWordWrap(True)
+
+        self.commentList = ListWidgetWithToolTipSignal()
+        self.commentList.itemActivated.connect(self.HandleCommentSelectByList)
+        self.commentList.toolTipAboutToShow.connect(self.HandleCommentToolTipAboutToShow)
+        self.commentList.setSortingEnabled(True)
+
+        cel.addWidget(clabel)
+        cel.addWidget(self.commentList)
+
+        # Set the current tab to the Object tab
+        tabs.blockSignals(False)
+        self.CreationTabChanged(0)
+
+    def CreateStampsTab(self):
+        """
+        Creates the contents of the stamps tab
+        """
         stampLabel = QtWidgets.QLabel(globals_.trans.string('Palette', 27))
 
         stampAddBtn = QtWidgets.QPushButton(globals_.trans.string('Palette', 28))
         stampAddBtn.clicked.connect(self.handleStampsAdd)
-        stampAddBtn.setEnabled(False)
+        stampAddBtn.setEnabled(len(self.scene.selectedItems()) > 0)
         self.stampAddBtn = stampAddBtn  # so we can enable/disable it later
         stampRemoveBtn = QtWidgets.QPushButton(globals_.trans.string('Palette', 29))
         stampRemoveBtn.clicked.connect(self.handleStampsRemove)
@@ -1300,35 +1126,11 @@ class ReggieWindow(QtWidgets.QMainWindow):
         stampL.addWidget(self.stampChooser, 3, 0, 1, 3)
         self.stampTab.setLayout(stampL)
 
-        # comments tab
-        self.commentsTab = QtWidgets.QWidget()
-        tabs.addTab(self.commentsTab, GetIcon('comments'), '')
-        tabs.setTabToolTip(7, globals_.trans.string('Palette', 33))
-
-        cel = QtWidgets.QVBoxLayout()
-        self.commentsTab.setLayout(cel)
-        self.entEditorLayout = cel
-
-        clabel = QtWidgets.QLabel(globals_.trans.string('Palette', 34))
-        clabel.setWordWrap(True)
-
-        self.commentList = ListWidgetWithToolTipSignal()
-        self.commentList.itemActivated.connect(self.HandleCommentSelectByList)
-        self.commentList.toolTipAboutToShow.connect(self.HandleCommentToolTipAboutToShow)
-        self.commentList.setSortingEnabled(True)
-
-        cel.addWidget(clabel)
-        cel.addWidget(self.commentList)
-
-        # Set the current tab to the Object tab
-        self.CreationTabChanged(0)
-
     def DeselectPathSelection(self, checked):
         """
         Deselects selected path nodes in the list
         """
-        for selecteditem in self.pathList.selectedItems():
-            selecteditem.setSelected(False)
+        self.pathList.clearSelection()
 
     def Autosave(self):
         """
@@ -1338,9 +1140,28 @@ class ReggieWindow(QtWidgets.QMainWindow):
         if not globals_.AutoSaveDirty: return
 
         data = globals_.Level.save()
+        globals_.AutoSaveDirty = False
+
+        # don't rewrite the settings if the changes were undone since the
+        # last autosave
+        if data == self.lastAutosaveData and self.fileSavePath == self.lastAutosavePath:
+            return
+
         setSetting('AutoSaveFilePath', self.fileSavePath)
         setSetting('AutoSaveFileData', QtCore.QByteArray(data))
-        globals_.AutoSaveDirty = False
+        self.lastAutosaveData = data
+        self.lastAutosavePath = self.fileSavePath
+
+    def ClearAutosave(self, path):
+        """
+        Removes the autosaved level data, since the level was saved to path
+        """
+        setSetting('AutoSaveFilePath', path)
+        setSetting('AutoSaveFileData', 'x')
+        self.lastAutosaveData = None
+
+    # Translation table that removes all whitespace from the clipboard text
+    ClipboardWhitespace = str.maketrans('', '', ' \n\r\t')
 
     def TrackClipboardUpdates(self):
         """
@@ -1348,35 +1169,40 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         if globals_.Initializing: return
         clip = self.systemClipboard.text()
+        if clip == self.lastClipboardText: return
+        self.lastClipboardText = clip
+
         if clip is not None and clip != '':
             clip = str(clip).strip()
 
             if clip.startswith('ReggieClip|') and clip.endswith('|%'):
-                self.clipboard = clip.replace(' ', '').replace('\n', '').replace('\r', '').replace('\t', '')
+                self.clipboard = clip.translate(self.ClipboardWhitespace)
 
                 self.actions['paste'].setEnabled(True)
             else:
                 self.clipboard = None
                 self.actions['paste'].setEnabled(False)
 
-    def XScrollChange(self, pos):
+    def QueueScrollChange(self, pos):
         """
-        Moves the Overview current position box based on X scroll bar value
+        Schedules an update of the Overview current position box, unless one
+        is already pending
         """
-        self.levelOverview.Xposlocator = pos
-        self.levelOverview.update()
+        if not self.scrollChangeTimer.isActive():
+            self.scrollChangeTimer.start()
 
-    def YScrollChange(self, pos):
+    def FlushScrollChange(self):
         """
-        Moves the Overview current position box based on Y scroll bar value
+        Moves the Overview current position box based on the scroll bar values
         """
-        self.levelOverview.Yposlocator = pos
-        self.levelOverview.update()
+        self.levelOverview.Xposlocator = self.view.XScrollBar.value()
+        self.levelOverview.Yposlocator = self.view.YScrollBar.value()
+        self.overviewUpdateTimer.start()
 
     def HandleWindowSizeChange(self, w, h):
         self.levelOverview.Hlocator = h
         self.levelOverview.Wlocator = w
-        self.levelOverview.update()
+        self.overviewUpdateTimer.start()
 
     def UpdateTitle(self):
         """
@@ -1391,11 +1217,15 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         if not globals_.Dirty: return False
 
-        msg = QtWidgets.QMessageBox()
-        msg.setText(globals_.trans.string('AutoSaveDlg', 2))
-        msg.setInformativeText(globals_.trans.string('AutoSaveDlg', 3))
-        msg.setStandardButtons(
-            QtWidgets.QMessageBox.Save | QtWidgets.QMessageBox.Discard | QtWidgets.QMessageBox.Cancel)
+        msg = self.dirtyMessageBox
+        if msg is None:
+            msg = QtWidgets.QMessageBox()
+            msg.setText(globals_.trans.string('AutoSaveDlg', 2))
+            msg.setInformativeText(globals_.trans.string('AutoSaveDlg', 3))
+            msg.setStandardButtons(
+                QtWidgets.QMessageBox.Save | QtWidgets.QMessageBox.Discard | QtWidgets.QMessageBox.Cancel)
+            self.dirtyMessageBox = msg
+
         msg.setDefaultButton(QtWidgets.QMessageBox.Save)
         ret = msg.exec_()
 
@@ -1422,18 +1252,14 @@ class ReggieWindow(QtWidgets.QMainWindow):
         if data is not None:
             # Iterate through the data
             idx = 0
-            while idx < len(data):
-                eventId = data[idx]
-                idx += 1
-                rawStrLen = data[idx:idx + 4]
-                idx += 4
-                strLen = (rawStrLen[0] << 24) | (rawStrLen[1] << 16) | (rawStrLen[2] << 8) | rawStrLen[3]
-                rawStr = data[idx:idx + strLen]
+            datalen = len(data)
+            while idx < datalen:
+                eventId, strLen = struct.unpack_from('>BI', data, idx)
+                idx += 5
+                eventTexts[eventId] = bytes(data[idx:idx + strLen]).decode('latin-1')
                 idx += strLen
-                newStr = ''
-                for char in rawStr: newStr += chr(char)
-                eventTexts[eventId] = newStr
 
+        self.eventChooser.setUpdatesEnabled(False)
         for id in range(64):
             item = self.eventChooserItems[id]
             value = 1 << id
@@ -1445,6 +1271,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
             item.setSelected(False)
 
         self.eventChooserItems[0].setSelected(True)
+        self.eventChooser.setUpdatesEnabled(True)
         txt0 = ''
         if 0 in eventTexts: txt0 = eventTexts[0]
         self.eventNotesEditor.setText(txt0)
@@ -1457,17 +1284,22 @@ class ReggieWindow(QtWidgets.QMainWindow):
         noteText = item.text(1)
         self.eventNotesEditor.setText(noteText)
 
-        selIdx = self.eventChooserItems.index(item)
-        isOn = (globals_.Area.defEvents & 1 << selIdx) == 1 << selIdx
-        if item.checkState(0) == Qt.Checked and not isOn:
+        selIdx = item.data(0, Qt.UserRole)
+        bit = 1 << selIdx
+        isOn = globals_.Area.defEvents & bit
+        checked = item.checkState(0) == Qt.Checked
+        if checked and not isOn:
             # Turn a bit on
-            globals_.Area.defEvents |= 1 << selIdx
+            globals_.Area.defEvents |= bit
             SetDirty()
-        elif item.checkState(0) == Qt.Unchecked and isOn:
+        elif not checked and isOn:
             # Turn a bit off (mask out 1 bit)
-            globals_.Area.defEvents &= ~(1 << selIdx)
+            globals_.Area.defEvents &= ~bit
             SetDirty()
 
+    # Header of each saved event note: the event id and the note length
+    EventNoteHeader = struct.Struct('>2I')
+
     def handleEventNotesEdit(self):
         """
         Handles the text within self.eventNotesEditor changing
@@ -1479,18 +1311,19 @@ class ReggieWindow(QtWidgets.QMainWindow):
         currentItem.setText(1, newText)
 
         # Save all the events to the metadata
-        data = b""
+        parts = []
+        packHeader = self.EventNoteHeader.pack
         for id in range(64):
-            idtext = str(self.eventChooserItems[id].text(1))
+            idtext = self.eventChooserItems[id].text(1)
             if idtext == '': continue
 
-            # Add the ID and string length
-            data += struct.pack(">2I", id, len(idtext))
+            rawtext = idtext.encode("ascii")
 
-            # Add the string
-            data += idtext.encode("ascii")
+            # Add the ID and string length, and the string
+            parts.append(packHeader(id, len(rawtext)))
+            parts.append(rawtext)
 
-        globals_.Area.Metadata.setBinData('EventNotes_A%d' % globals_.Area.areanum, data)
+        globals_.Area.Metadata.setBinData('EventNotes_A%d' % globals_.Area.areanum, b''.join(parts))
         SetDirty()
 
     def handleStampsAdd(self):
@@ -1500,16 +1333,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         # Create a ReggieClip
         selitems = self.scene.selectedItems()
         if len(selitems) == 0: return
-        clipboard_o = []
-        clipboard_s = []
-        ii = isinstance
-        type_obj = ObjectItem
-        type_spr = SpriteItem
-        for obj in selitems:
-            if ii(obj, type_obj):
-                clipboard_o.append(obj)
-            elif ii(obj, type_spr):
-                clipboard_s.append(obj)
+        clipboard_o, clipboard_s = self.SplitClipboardItems(selitems)
         RegClp = self.encodeObjects(clipboard_o, clipboard_s)
 
         # Create a Stamp
@@ -1533,27 +1357,17 @@ class ReggieWindow(QtWidgets.QMainWindow):
         if fn == '': return
 
         with open(fn, 'r', encoding='utf-8') as file:
-            filedata = file.read()
-
-            if not filedata.startswith('stamps\n------\n'): return
-
-            filesplit = filedata.split('\n')[3:]
-            i = 0
-            while i < len(filesplit):
-                try:
-                    # Get data
-                    name = filesplit[i]
-                    rc = filesplit[i + 1]
+            if file.readline() + file.readline() != 'stamps\n------\n': return
 
-                    # Increment the line counter by 3, tp
-                    # account for the blank line
-                    i += 3
+            # Each stamp is a blank line followed by its name and clip
+            file.readline()
+            while True:
+                name = file.readline()
+                rc = file.readline()
+                if not rc: return
 
-                except IndexError:
-                    return
-
-                else:
-                    self.stampChooser.addStamp(Stamp(rc, name))
+                file.readline()
+                self.stampChooser.addStamp(Stamp(rc.rstrip('\n'), name.rstrip('\n')))
 
     def handleStampsSave(self):
         """
@@ -1565,17 +1379,10 @@ class ReggieWindow(QtWidgets.QMainWindow):
         fn = QtWidgets.QFileDialog.getSaveFileName(self, globals_.trans.string('FileDlgs', 3), '', filetypes)[0]
         if fn == '': return
 
-        newdata = ''
-        newdata += 'stamps\n'
-        newdata += '------\n'
-
-        for stampobj in self.stampChooser.model.items:
-            newdata += '\n'
-            newdata += stampobj.Name + '\n'
-            newdata += stampobj.ReggieClip + '\n'
-
         with open(fn, 'w', encoding='utf-8') as f:
-            f.write(newdata)
+            f.write('stamps\n------\n')
+            for stampobj in self.stampChooser.model.items:
+                f.write('\n%s\n%s\n' % (stampobj.Name, stampobj.ReggieClip))
 
     def handleStampSelectionChanged(self):
         """
@@ -1597,16 +1404,10 @@ class ReggieWindow(QtWidgets.QMainWindow):
         if not stamp:
             return
 
-        text = self.stampNameEdit.text()
-        stamp.Name = text
+        stamp.Name = self.stampNameEdit.text()
         stamp.update()
 
-        # Try to get it to update!!! But fail. D:
-        for i in range(3):
-            self.stampChooser.updateGeometries()
-            self.stampChooser.update(self.stampChooser.currentIndex())
-            self.stampChooser.update()
-            self.stampChooser.repaint()
+        self.stampChooser.stampChanged(stamp)
 
     def AboutBox(self):
         """
@@ -1665,9 +1466,10 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         Select all objects in the current area
         """
-        paintRect = QtGui.QPainterPath()
-        paintRect.addRect(float(0), float(0), float(1024 * 24), float(512 * 24))
-        self.scene.setSelectionArea(paintRect)
+        # setSelected() ignores hidden and unselectable items, so this
+        # avoids intersecting every item with a level-sized selection area
+        for item in self.scene.items():
+            item.setSelected(True)
 
     def Deselect(self):
         """
@@ -1689,6 +1491,23 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         self.undoStack.redo()
 
+    def SplitClipboardItems(self, items):
+        """
+        Splits items into the lists of objects and sprites that can be put on
+        the clipboard, ignoring all other items
+        """
+        clipboard_o = []
+        clipboard_s = []
+
+        # neither item type is subclassed, so the exact type can be used
+        add = {ObjectItem: clipboard_o.append, SpriteItem: clipboard_s.append}.get
+        for obj in items:
+            append = add(type(obj))
+            if append is not None:
+                append(obj)
+
+        return clipboard_o, clipboard_s
+
     def Cut(self):
         """
         Cuts the selected items
@@ -1698,23 +1517,19 @@ class ReggieWindow(QtWidgets.QMainWindow):
         self.scene.clearSelection()
 
         if len(selitems) > 0:
-            clipboard_o = []
-            clipboard_s = []
-            ii = isinstance
-            type_obj = ObjectItem
-            type_spr = SpriteItem
+            clipboard_o, clipboard_s = self.SplitClipboardItems(selitems)
 
-            for obj in selitems:
-                if ii(obj, type_obj):
-                    obj.delete()
-                    obj.setSelected(False)
-                    self.scene.removeItem(obj)
-                    clipboard_o.append(obj)
-                elif ii(obj, type_spr):
-                    obj.delete()
-                    obj.setSelected(False)
-                    self.scene.removeItem(obj)
-                    clipboard_s.append(obj)
+            # repaint the view once after all items are removed
+            removeItem = self.scene.removeItem
+            self.view.setUpdatesEnabled(False)
+            try:
+                for items in (clipboard_o, clipboard_s):
+                    for obj in items:
+                        obj.delete()
+                        obj.setSelected(False)
+                        removeItem(obj)
+            finally:
+                self.view.setUpdatesEnabled(True)
 
             if len(clipboard_o) > 0 or len(clipboard_s) > 0:
                 SetDirty()
@@ -1733,22 +1548,15 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         selitems = self.scene.selectedItems()
         if len(selitems) > 0:
-            clipboard_o = []
-            clipboard_s = []
-            ii = isinstance
-            type_obj = ObjectItem
-            type_spr = SpriteItem
-
-            for obj in selitems:
-                if ii(obj, type_obj):
-                    clipboard_o.append(obj)
-                elif ii(obj, type_spr):
-                    clipboard_s.append(obj)
+            clipboard_o, clipboard_s = self.SplitClipboardItems(selitems)
 
             if len(clipboard_o) > 0 or len(clipboard_s) > 0:
                 self.actions['paste'].setEnabled(True)
                 self.clipboard = self.encodeObjects(clipboard_o, clipboard_s)
-                self.systemClipboard.setText(self.clipboard)
+
+                # don't bother the system clipboard if it already has this clip
+                if self.clipboard != self.lastClipboardText:
+                    self.systemClipboard.setText(self.clipboard)
 
     def Paste(self):
         """
@@ -1761,24 +1569,36 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         Encode a set of objects and sprites into a string
         """
-        convclip = ['ReggieClip']
-
         # get objects
-        clipboard_o.sort(key=lambda x: x.zValue())
+        clipboard_o.sort(key=methodcaller('zValue'))
 
-        for item in clipboard_o:
-            convclip.append('0:%d:%d:%d:%d:%d:%d:%d' % (
-            item.tileset, item.type, item.layer, item.objx, item.objy, item.width, item.height))
+        convclip = ['ReggieClip']
+        convclip.extend([
+            '0:%d:%d:%d:%d:%d:%d:%d' % (item.tileset, item.type, item.layer, item.objx, item.objy, item.width, item.height)
+            for item in clipboard_o
+        ])
 
         # get sprites
         for item in clipboard_s:
-            data = item.spritedata
-            convclip.append('1:%d:%d:%d:%d:%d:%d:%d:%d:%d:%d' % (
-            item.type, item.objx, item.objy, data[0], data[1], data[2], data[3], data[4], data[5], data[7]))
+            d0, d1, d2, d3, d4, d5, _, d7 = item.spritedata[:8]
+            convclip.append('1:%d:%d:%d:%d:%d:%d:%d:%d:%d:%d' % (item.type, item.objx, item.objy, d0, d1, d2, d3, d4, d5, d7))
 
         convclip.append('%')
         return '|'.join(convclip)
 
+    @staticmethod
+    def AppendToLayer(AreaLayer, newObjs, emptyBase):
+        """
+        Appends objects to an area layer, stacking them above its current top
+        """
+        base = (AreaLayer[-1].zValue() + 1) if AreaLayer else emptyBase
+        append = AreaLayer.append
+        for i, obj in enumerate(newObjs):
+            append(obj)
+            obj.setZValue(base + i)
+
+        globals_.Area.layerGeneration += 1
+
     def placeEncodedObjects(self, encoded, select=True, xOverride=None, yOverride=None):
         """
         Decode and place a set of objects
@@ -1800,78 +1620,49 @@ class ReggieWindow(QtWidgets.QMainWindow):
 
         if not (encoded.startswith('ReggieClip|') and encoded.endswith('|%')): return
 
-        clip = encoded.split('|')[1:-1]
+        clip = encoded[11:-2]
 
-        if len(clip) > 300:
+        if clip.count('|') >= 300:
             result = QtWidgets.QMessageBox.warning(self, 'Reggie', globals_.trans.string('MainWindow', 1),
                                                    QtWidgets.QMessageBox.Yes, QtWidgets.QMessageBox.No)
             if result == QtWidgets.QMessageBox.No: return
 
-        layers, sprites = self.getEncodedObjects(encoded)
+        layers, sprites = self.DecodeClip(clip)
+
+        addItem = self.scene.addItem
+        addSprite = self.spriteList.addSprite
+        appendSprite = globals_.Area.sprites.append
+        appendAdded = added.append
 
         # Go through the sprites
         for spr in sprites:
-            x = spr.objx / 16
-            y = spr.objy / 16
-            if x < x1: x1 = x
-            if x > x2: x2 = x
-            if y < y1: y1 = y
-            if y > y2: y2 = y
-
-            globals_.Area.sprites.append(spr)
-            added.append(spr)
-            self.spriteList.addSprite(spr)
-            self.scene.addItem(spr)
+            appendSprite(spr)
+            appendAdded(spr)
+            addSprite(spr)
+            addItem(spr)
 
         # Go through the objects
-        for layer in layers:
-            for obj in layer:
-                xs = obj.objx
-                xe = obj.objx + obj.width - 1
-                ys = obj.objy
-                ye = obj.objy + obj.height - 1
-                if xs < x1: x1 = xs
-                if xe > x2: x2 = xe
-                if ys < y1: y1 = ys
-                if ye > y2: y2 = ye
-
-                added.append(obj)
-                self.scene.addItem(obj)
-
-        layer0, layer1, layer2 = layers
-
-        if len(layer0) > 0:
-            AreaLayer = globals_.Area.layers[0]
-            if len(AreaLayer) > 0:
-                z = AreaLayer[-1].zValue() + 1
-            else:
-                z = 16384
-            for obj in layer0:
-                AreaLayer.append(obj)
-                obj.setZValue(z)
-                z += 1
-
-        if len(layer1) > 0:
-            AreaLayer = globals_.Area.layers[1]
-            if len(AreaLayer) > 0:
-                z = AreaLayer[-1].zValue() + 1
-            else:
-                z = 8192
-            for obj in layer1:
-                AreaLayer.append(obj)
-                obj.setZValue(z)
-                z += 1
-
-        if len(layer2) > 0:
-            AreaLayer = globals_.Area.layers[2]
-            if len(AreaLayer) > 0:
-                z = AreaLayer[-1].zValue() + 1
-            else:
-                z = 0
-            for obj in layer2:
-                AreaLayer.append(obj)
-                obj.setZValue(z)
-                z += 1
+        objs = [obj for layer in layers for obj in layer]
+        for obj in objs:
+            appendAdded(obj)
+            addItem(obj)
+
+        # Find the bounding box of everything that was pasted, in tiles
+        left = [spr.objx / 16 for spr in sprites]
+        top = [spr.objy / 16 for spr in sprites]
+        right = left + [obj.objx + obj.width - 1 for obj in objs]
+        bottom = top + [obj.objy + obj.height - 1 for obj in objs]
+        left += [obj.objx for obj in objs]
+        top += [obj.objy for obj in objs]
+
+        x1 = min(x1, min(left, default=x1))
+        x2 = max(x2, max(right, default=x2))
+        y1 = min(y1, min(top, default=y1))
+        y2 = max(y2, max(bottom, default=y2))
+
+        for AreaLayer, newObjs, emptyBase in zip(globals_.Area.layers, layers, (16384, 8192, 0)):
+            if newObjs:
+                self.AppendToLayer(AreaLayer, newObjs, emptyBase)
 
         # now center everything
         zoomscaler = (self.ZoomLevel / 100.0)
@@ -1915,68 +1706,70 @@ class ReggieWindow(QtWidgets.QMainWindow):
 
         return added
 
+    # Matches one object (0:...) or sprite (1:...) item of a ReggieClip. The
+    # numbers can't be negative, since they only match digits.
+    ClipItemRegex = re.compile(
+        r'(?:^|\|)(?:'
+        r'0:(\d+):(\d+):(\d+):(\d+):(\d+):(\d+):(\d+)'
+        r'|1:(\d+):(\d+):(\d+):(\d+):(\d+):(\d+):(\d+):(\d+):(\d+):(\d+)'
+        r')(?=\||\Z)'
+    )
+
     def getEncodedObjects(self, encoded):
         """
         Create the objects from a ReggieClip
         """
+        if not (encoded.startswith('ReggieClip|') and encoded.endswith('|%')): return
 
-        layers = ([], [], [])
-        sprites = []
+        clip = encoded[11:-2]
 
-        try:
-            if not (encoded.startswith('ReggieClip|') and encoded.endswith('|%')): return
+        if clip.count('|') >= 300:
+            result = QtWidgets.QMessageBox.warning(self, 'Reggie', globals_.trans.string('MainWindow', 1),
+                                                   QtWidgets.QMessageBox.Yes, QtWidgets.QMessageBox.No)
+            if result == QtWidgets.QMessageBox.No:
+                return
 
-            clip = encoded[11:-2].split('|')
+        return self.DecodeClip(clip)
+
+    def DecodeClip(self, clip):
+        """
+        Create the objects from the items of an already validated ReggieClip
+        """
+        layers = ([], [], [])
+        sprites = []
 
-            if len(clip) > 300:
-                result = QtWidgets.QMessageBox.warning(self, 'Reggie', globals_.trans.string('MainWindow', 1),
-                                                       QtWidgets.QMessageBox.Yes, QtWidgets.QMessageBox.No)
-                if result == QtWidgets.QMessageBox.No:
-                    return
+        # malformed items simply don't match, so they are skipped
+        for match in self.ClipItemRegex.finditer(clip):
+            fields = match.groups()
 
-            for item in clip:
+            try:
                 # Check to see whether it's an object or sprite
                 # and add it to the correct stack
-                split = item.split(':')
-                if split[0] == '0':
+                if fields[0] is not None:
                     # object
-                    if len(split) != 8: continue
-
-                    tileset = int(split[1])
-                    type = int(split[2])
-                    layer = int(split[3])
-                    objx = int(split[4])
-                    objy = int(split[5])
-                    width = int(split[6])
-                    height = int(split[7])
+                    tileset, type, layer, objx, objy, width, height = map(int, fields[:7])
 
                     # basic sanity checks
-                    if tileset < 0 or tileset > 3: continue
-                    if type < 0 or type > 255: continue
-                    if layer < 0 or layer > 2: continue
-                    if objx < 0 or objx > 1023: continue
-                    if objy < 0 or objy > 511: continue
-                    if width < 1 or width > 1023: continue
-                    if height < 1 or height > 511: continue
+                    if not (tileset <= 3 and type <= 255 and layer <= 2 and objx <= 1023 and objy <= 511
+                            and 1 <= width <= 1023 and 1 <= height <= 511):
+                        continue
 
                     newitem = self.CreateObject(tileset, type, layer, objx, objy, width, height, add_to_scene = False)
 
                     layers[layer].append(newitem)
 
-                elif split[0] == '1':
+                else:
                     # sprite
-                    if len(split) != 11: continue
+                    type, objx, objy, d0, d1, d2, d3, d4, d5, d7 = map(int, fields[7:])
+                    data = bytes((d0, d1, d2, d3, d4, d5, 0, d7))
 
-                    objx = int(split[2])
-                    objy = int(split[3])
-                    data = bytes(map(int, [split[4], split[5], split[6], split[7], split[8], split[9], '0', split[10]]))
-
-                    newitem = SpriteItem(int(split[1]), objx, objy, data)
+                    newitem = SpriteItem(type, objx, objy, data)
                     sprites.append(newitem)
 
-        except ValueError:
-            # an int() probably failed somewhere
-            pass
+            except ValueError:
+                # an int() or a sprite data byte probably failed, so only
+                # skip this item
+                continue
 
         return layers, sprites
 
@@ -2068,34 +1861,26 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         Merges selected sprite locations
         """
-        items = self.scene.selectedItems()
-        if len(items) == 0: return
+        locs = [obj for obj in self.scene.selectedItems() if isinstance(obj, LocationItem)]
+        if not locs: return
 
-        newx = 999999
-        newy = 999999
-        neww = 0
-        newh = 0
+        # merging only needs the union of the location rects, so no pairwise
+        # overlap tests are needed
+        newx = min(obj.objx for obj in locs)
+        newy = min(obj.objy for obj in locs)
+        neww = max(obj.objx + obj.width for obj in locs)
+        newh = max(obj.objy + obj.height for obj in locs)
 
-        type_loc = LocationItem
-        for obj in items:
-            if isinstance(obj, type_loc):
-                if obj.objx < newx:
-                    newx = obj.objx
-                if obj.objy < newy:
-                    newy = obj.objy
-                if obj.width + obj.objx > neww:
-                    neww = obj.width + obj.objx
-                if obj.height + obj.objy > newh:
-                    newh = obj.height + obj.objy
-                obj.delete()
-                obj.setSelected(False)
-                self.scene.removeItem(obj)
-                self.levelOverview.update()
-                SetDirty()
+        for obj in locs:
+            obj.delete()
+            obj.setSelected(False)
+            self.scene.removeItem(obj)
 
-        if newx != 999999 and newy != 999999:
-            loc = self.CreateLocation(newx, newy, neww - newx, newh - newy)
-            loc.setSelected(True)
+        self.levelOverview.update()
+        SetDirty()
+
+        loc = self.CreateLocation(newx, newy, neww - newx, newh - newy)
+        loc.setSelected(True)
 
     ###########################################################################
     # Functions that create items
@@ -2108,14 +1893,9 @@ class ReggieWindow(QtWidgets.QMainWindow):
         function returns None if there is no free location id available.
         """
         if id_ is None:
-            # This can be done more efficiently, but 255 is not that big, so it
-            # does not really matter.
-            all_ids = set(loc.id for loc in globals_.Area.locations)
+            id_ = LowestFreeId((loc.id for loc in globals_.Area.locations), 1)
 
-            for id_ in range(1, 256):
-                if id_ not in all_ids:
-                    break
-            else:
+            if id_ is None:
                 print("ReggieWindow#CreateLocation: No free location id")
                 return None
 
@@ -2154,6 +1934,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
 
         if add_to_scene:
             layer_list.append(obj)
+            globals_.Area.layerGeneration += 1
             obj.positionChanged = self.HandleObjPosChange
             self.scene.addItem(obj)
 
@@ -2168,20 +1949,12 @@ class ReggieWindow(QtWidgets.QMainWindow):
         can be created.
         """
         if id_ is None:
-            # This can be done more efficiently, but 255 is not that big
-            # a number so it doesn't really matter
-            all_ids = set(ent.entid for ent in globals_.Area.entrances)
-
-            id_ = 0
-            while id_ <= 255:
-                if id_ not in all_ids:
-                    break
-                id_ += 1
+            id_ = LowestFreeId(ent.entid for ent in globals_.Area.entrances)
 
-            if id_ == 256:
+            if id_ is None:
                 print("ReggieWindow#CreateEntrance: No free entrance id")
                 return None
-        elif id_ in all_ids:
+        elif any(ent.entid == id_ for ent in globals_.Area.entrances):
             print("ReggieWindow#CreateEntrance: Given entrance id (%d) already in use" % id_)
             return None
 
@@ -2249,21 +2022,23 @@ class ReggieWindow(QtWidgets.QMainWindow):
         if (arcdata[0] & 0xF0) == 0x40:  # If LH-compressed
             try:
                 arcdata = lh.UncompressLH(arcdata)
-            except IndexError:
+            except (IndexError, RuntimeError):
                 QtWidgets.QMessageBox.warning(None, globals_.trans.string('Err_Decompress', 0),
                                               globals_.trans.string('Err_Decompress', 1, '[file]', str(fn)))
                 return
 
         arc = archive.U8.load(arcdata)
 
-        # get the area count
+        # index the files by name and get the area count
+        filesByName = {}
         areacount = 0
 
         for item, val in arc.files:
             if val is not None:
                 # it's a file
-                fname = item[item.rfind('/') + 1:]
-                if fname.startswith('course'):
+                fname = item.rpartition('/')[2]
+                filesByName[fname] = val
+                if fname.startswith('course') and fname[6:7].isdigit():
                     maxarea = int(fname[6])
                     if maxarea > areacount: areacount = maxarea
 
@@ -2275,27 +2050,10 @@ class ReggieWindow(QtWidgets.QMainWindow):
         area = dlg.areaCombo.currentIndex() + 1
 
         # get the required files
-        reqcourse = 'course%d.bin' % area
-        reqL0 = 'course%d_bgdatL0.bin' % area
-        reqL1 = 'course%d_bgdatL1.bin' % area
-        reqL2 = 'course%d_bgdatL2.bin' % area
-
-        course = None
-        L0 = None
-        L1 = None
-        L2 = None
-
-        for item, val in arc.files:
-            if val is not None:
-                fname = item.split('/')[-1]
-                if fname == reqcourse:
-                    course = val
-                elif fname == reqL0:
-                    L0 = val
-                elif fname == reqL1:
-                    L1 = val
-                elif fname == reqL2:
-                    L2 = val
+        course = filesByName.get('course%d.bin' % area)
+        L0 = filesByName.get('course%d_bgdatL0.bin' % area)
+        L1 = filesByName.get('course%d_bgdatL1.bin' % area)
+        L2 = filesByName.get('course%d_bgdatL2.bin' % area)
 
         # add them to our level
         newID = len(globals_.Level.areas) + 1
@@ -2394,6 +2152,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
             for box in boxList:
                 ToolbarSettings[box.InternalName] = box.isChecked()
         setSetting('ToolbarActs', ToolbarSettings)
+        globals_.ToolbarActs = None
 
         # Get the theme settings
         setSetting('Theme', dlg.themesTab.themeBox.currentText())
@@ -2434,30 +2193,43 @@ class ReggieWindow(QtWidgets.QMainWindow):
         if fn == '': return
         self.LoadLevel(None, str(fn), True, 1)
 
-    def HandleSave(self):
+    # Shared block of null bytes that level padding is written from
+    ZeroPad = bytes(65536)
+
+    def WritePadded(self, f, data, padLength):
         """
-        Save a level back to the archive
+        Writes level data to a file, followed by padLength null bytes
         """
-        if not self.fileSavePath or self.fileSavePath.endswith('.arc.LH'):
-            self.HandleSaveAs()
-            return
+        f.write(data)
 
-        # global globals_.Dirty, globals_.AutoSaveDirty
-        data = globals_.Level.save()
+        zeroes = memoryview(self.ZeroPad)
+        while padLength > 0:
+            f.write(zeroes[:padLength])
+            padLength -= len(zeroes)
 
-        # maybe pad with null bytes
-        if globals_.EnablePadding:
-            pad_length = globals_.PaddingLength - len(data)
-            if pad_length < 0:
-                # err: orig data is longer than padding data
-                QtWidgets.QMessageBox.warning(None, globals_.trans.string('Err_Save', 0), globals_.trans.string('Err_Save', 2, '[orig-len]', len(data), '[pad-len]', globals_.PaddingLength))
-                return False
+    def GetPaddingLength(self, data):
+        """
+        Returns how many null bytes to pad saved level data with. Warns and
+        returns None if the data is already longer than the padding length.
+        """
+        if not globals_.EnablePadding:
+            return 0
+
+        pad_length = globals_.PaddingLength - len(data)
+        if pad_length < 0:
+            # err: orig data is longer than padding data
+            QtWidgets.QMessageBox.warning(None, globals_.trans.string('Err_Save', 0), globals_.trans.string('Err_Save', 2, '[orig-len]', len(data), '[pad-len]', globals_.PaddingLength))
+            return None
 
-            data += bytes(pad_length)
+        return pad_length
 
+    def WriteSave(self, data, pad_length=0):
+        """
+        Writes level data to the current file and marks the level as saved
+        """
         try:
             with open(self.fileSavePath, 'wb') as f:
-                f.write(data)
+                self.WritePadded(f, data, pad_length)
         except IOError as e:
             QtWidgets.QMessageBox.warning(None, globals_.trans.string('Err_Save', 0),
                                           globals_.trans.string('Err_Save', 1, '[err1]', e.args[0], '[err2]', e.args[1]))
@@ -2467,11 +2239,10 @@ class ReggieWindow(QtWidgets.QMainWindow):
         globals_.AutoSaveDirty = False
         self.UpdateTitle()
 
-        setSetting('AutoSaveFilePath', self.fileSavePath)
-        setSetting('AutoSaveFileData', 'x')
+        self.ClearAutosave(self.fileSavePath)
         return True
 
-    def HandleSaveNewArea(self, course, L0, L1, L2):
+    def HandleSave(self):
         """
         Save a level back to the archive
         """
@@ -2479,23 +2250,24 @@ class ReggieWindow(QtWidgets.QMainWindow):
             self.HandleSaveAs()
             return
 
-        # global globals_.Dirty, globals_.AutoSaveDirty
-        data = globals_.Level.saveNewArea(course, L0, L1, L2)
-        try:
-            with open(self.fileSavePath, 'wb') as f:
-                f.write(data)
-        except IOError as e:
-            QtWidgets.QMessageBox.warning(None, globals_.trans.string('Err_Save', 0),
-                                          globals_.trans.string('Err_Save', 1, '[err1]', e.args[0], '[err2]', e.args[1]))
+        data = globals_.Level.save()
+
+        # maybe pad with null bytes
+        pad_length = self.GetPaddingLength(data)
+        if pad_length is None:
             return False
 
-        globals_.Dirty = False
-        globals_.AutoSaveDirty = False
-        self.UpdateTitle()
+        return self.WriteSave(data, pad_length)
 
-        setSetting('AutoSaveFilePath', self.fileSavePath)
-        setSetting('AutoSaveFileData', 'x')
-        return True
+    def HandleSaveNewArea(self, course, L0, L1, L2):
+        """
+        Save a level back to the archive
+        """
+        if not self.fileSavePath or self.fileSavePath.endswith('.arc.LH'):
+            self.HandleSaveAs()
+            return
+
+        return self.WriteSave(globals_.Level.saveNewArea(course, L0, L1, L2))
 
     def HandleSaveAs(self, copy = False):
         """
@@ -2517,23 +2289,17 @@ class ReggieWindow(QtWidgets.QMainWindow):
         data = globals_.Level.save()
 
         # maybe pad with null bytes
-        if globals_.EnablePadding:
-            pad_length = globals_.PaddingLength - len(data)
-            if pad_length < 0:
-                # err: orig data is longer than padding data
-                QtWidgets.QMessageBox.warning(None, globals_.trans.string('Err_Save', 0), globals_.trans.string('Err_Save', 2, '[orig-len]', len(data), '[pad-len]', globals_.PaddingLength))
-                return False
-
-            data += bytes(pad_length)
+        pad_length = self.GetPaddingLength(data)
+        if pad_length is None:
+            return False
 
         with open(fn, 'wb') as f:
-            f.write(data)
+            self.WritePadded(f, data, pad_length)
 
         if copy:
             return
 
-        setSetting('AutoSaveFilePath', fn)
-        setSetting('AutoSaveFileData', 'x')
+        self.ClearAutosave(fn)
 
         self.UpdateTitle()
         self.RecentMenu.AddToList(self.fileSavePath)
@@ -2573,42 +2339,32 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         Handle toggling of layer 0 being shown
         """
-        # global globals_.Layer0Shown
-
         globals_.Layer0Shown = checked
-
-        if globals_.Area is not None:
-            for obj in globals_.Area.layers[0]:
-                obj.setVisible(globals_.Layer0Shown)
-
-        self.scene.update()
+        self.ShowLayer(0, checked)
 
     def HandleUpdateLayer1(self, checked):
         """
         Handle toggling of layer 1 being shown
         """
-        # global globals_.Layer1Shown
-
         globals_.Layer1Shown = checked
-
-        if globals_.Area is not None:
-            for obj in globals_.Area.layers[1]:
-                obj.setVisible(globals_.Layer1Shown)
-
-        self.scene.update()
+        self.ShowLayer(1, checked)
 
     def HandleUpdateLayer2(self, checked):
         """
         Handle toggling of layer 2 being shown
         """
-        # global globals_.Layer2Shown
-
         globals_.Layer2Shown = checked
+        self.ShowLayer(2, checked)
 
+    def ShowLayer(self, layer, shown):
+        """
+        Shows or hides the objects of a layer
+        """
         if globals_.Area is not None:
-            for obj in globals_.Area.layers[2]:
-                obj.setVisible(globals_.Layer2Shown)
+            for obj in globals_.Area.layers[layer]:
+                obj.setVisible(shown)
 
+        # the tiles are drawn by the scene background, so repaint everything
         self.scene.update()
 
     def HandleTilesetAnimToggle(self, checked):
@@ -2617,7 +2373,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         globals_.TilesetsAnimating = checked
         for tile in globals_.Tiles:
-            if tile is not None: tile.resetAnimation()
+            if tile is not None and tile.isAnimated: tile.resetAnimation()
 
         self.scene.update()
 
@@ -2663,18 +2419,25 @@ class ReggieWindow(QtWidgets.QMainWindow):
 
         if globals_.Area is not None:
             globals_.DirtyOverride += 1
-            for spr in globals_.Area.sprites:
-                spr.UpdateRects()
-                if globals_.SpriteImagesShown and not globals_.Initializing:
+            sprites = globals_.Area.sprites
+
+            if globals_.Initializing:
+                for spr in sprites:
+                    spr.UpdateRects()
+
+            elif globals_.SpriteImagesShown:
+                for spr in sprites:
+                    spr.UpdateRects()
                     spr.setPos(
                         (spr.objx + spr.ImageObj.xOffset) * 1.5,
                         (spr.objy + spr.ImageObj.yOffset) * 1.5,
                     )
-                elif not globals_.Initializing:
-                    spr.setPos(
-                        spr.objx * 1.5,
-                        spr.objy * 1.5,
-                    )
+
+            else:
+                for spr in sprites:
+                    spr.UpdateRects()
+                    spr.setPos(spr.objx * 1.5, spr.objy * 1.5)
+
             globals_.DirtyOverride -= 1
 
         self.scene.update()
@@ -2685,12 +2448,15 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         globals_.LocationsShown = checked
 
-        if globals_.Area is not None:
+        setSetting('ShowLocations', globals_.LocationsShown)
+
+        # nothing else is drawn differently, so only repaint if there's
+        # something to show or hide
+        if globals_.Area is not None and globals_.Area.locations:
             for loc in globals_.Area.locations:
                 loc.setVisible(globals_.LocationsShown)
 
-        setSetting('ShowLocations', globals_.LocationsShown)
-        self.scene.update()
+            self.scene.update()
 
     def HandleCommentsVisibility(self, checked):
         """
@@ -2698,12 +2464,13 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         globals_.CommentsShown = checked
 
-        if globals_.Area is not None:
+        setSetting('ShowComments', globals_.CommentsShown)
+
+        if globals_.Area is not None and globals_.Area.comments:
             for com in globals_.Area.comments:
                 com.setVisible(globals_.CommentsShown)
 
-        setSetting('ShowComments', globals_.CommentsShown)
-        self.scene.update()
+            self.scene.update()
 
     def HandlePathsVisibility(self, checked):
         """
@@ -2711,112 +2478,96 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         globals_.PathsShown = checked
 
-        if globals_.Area is not None:
+        setSetting('ShowPaths', globals_.PathsShown)
+
+        if globals_.Area is not None and (globals_.Area.paths or globals_.Area.pathdata):
             for node in globals_.Area.paths:
                 node.setVisible(globals_.PathsShown)
 
             for path in globals_.Area.pathdata:
                 path['peline'].setVisible(globals_.PathsShown)
 
-        setSetting('ShowPaths', globals_.PathsShown)
-        self.scene.update()
+            self.scene.update()
+
+    FreezeFlags = QtWidgets.QGraphicsItem.ItemIsSelectable | QtWidgets.QGraphicsItem.ItemIsMovable
+
+    def SetItemsFrozen(self, items, frozen):
+        """
+        Makes items unselectable and immovable, or the reverse
+        """
+        flags = self.FreezeFlags
+        if frozen:
+            for item in items:
+                item.setFlags(item.flags() & ~flags)
+        else:
+            for item in items:
+                item.setFlags(item.flags() | flags)
 
     def HandleObjectsFreeze(self, checked):
         """
         Handle toggling of objects being frozen
         """
         globals_.ObjectsFrozen = checked
-        flag1 = QtWidgets.QGraphicsItem.ItemIsSelectable
-        flag2 = QtWidgets.QGraphicsItem.ItemIsMovable
 
         if globals_.Area is not None:
-            for layer in globals_.Area.layers:
-                for obj in layer:
-                    obj.setFlag(flag1, not globals_.ObjectsFrozen)
-                    obj.setFlag(flag2, not globals_.ObjectsFrozen)
+            self.SetItemsFrozen(chain.from_iterable(globals_.Area.layers), checked)
 
-        setSetting('FreezeObjects', globals_.ObjectsFrozen)
-        self.scene.update()
+        setSetting('FreezeObjects', checked)
 
     def HandleSpritesFreeze(self, checked):
         """
         Handle toggling of sprites being frozen
         """
         globals_.SpritesFrozen = checked
-        flag1 = QtWidgets.QGraphicsItem.ItemIsSelectable
-        flag2 = QtWidgets.QGraphicsItem.ItemIsMovable
 
         if globals_.Area is not None:
-            for spr in globals_.Area.sprites:
-                spr.setFlag(flag1, not globals_.SpritesFrozen)
-                spr.setFlag(flag2, not globals_.SpritesFrozen)
+            self.SetItemsFrozen(globals_.Area.sprites, checked)
 
-        setSetting('FreezeSprites', globals_.SpritesFrozen)
-        self.scene.update()
+        setSetting('FreezeSprites', checked)
 
     def HandleEntrancesFreeze(self, checked):
         """
         Handle toggling of entrances being frozen
         """
         globals_.EntrancesFrozen = checked
-        flag1 = QtWidgets.QGraphicsItem.ItemIsSelectable
-        flag2 = QtWidgets.QGraphicsItem.ItemIsMovable
 
         if globals_.Area is not None:
-            for ent in globals_.Area.entrances:
-                ent.setFlag(flag1, not globals_.EntrancesFrozen)
-                ent.setFlag(flag2, not globals_.EntrancesFrozen)
+            self.SetItemsFrozen(globals_.Area.entrances, checked)
 
-        setSetting('FreezeEntrances', globals_.EntrancesFrozen)
-        self.scene.update()
+        setSetting('FreezeEntrances', checked)
 
     def HandleLocationsFreeze(self, checked):
         """
         Handle toggling of locations being frozen
         """
         globals_.LocationsFrozen = checked
-        flag1 = QtWidgets.QGraphicsItem.ItemIsSelectable
-        flag2 = QtWidgets.QGraphicsItem.ItemIsMovable
 
         if globals_.Area is not None:
-            for loc in globals_.Area.locations:
-                loc.setFlag(flag1, not globals_.LocationsFrozen)
-                loc.setFlag(flag2, not globals_.LocationsFrozen)
+            self.SetItemsFrozen(globals_.Area.locations, checked)
 
-        setSetting('FreezeLocations', globals_.LocationsFrozen)
-        self.scene.update()
+        setSetting('FreezeLocations', checked)
 
     def HandlePathsFreeze(self, checked):
         """
         Handle toggling of path nodes being frozen
         """
         globals_.PathsFrozen = checked
-        flag1 = QtWidgets.QGraphicsItem.ItemIsSelectable
-        flag2 = QtWidgets.QGraphicsItem.ItemIsMovable
 
         if globals_.Area is not None:
-            for node in globals_.Area.paths:
-                node.setFlag(flag1, not globals_.PathsFrozen)
-                node.setFlag(flag2, not globals_.PathsFrozen)
+            self.SetItemsFrozen(globals_.Area.paths, checked)
 
-        setSetting('FreezePaths', globals_.PathsFrozen)
-        self.scene.update()
+        setSetting('FreezePaths', checked)
 
     def HandleCommentsFreeze(self, checked):
         """
         Handle toggling of comments being frozen
         """
         globals_.CommentsFrozen = checked
-        flag1 = QtWidgets.QGraphicsItem.ItemIsSelectable
-        flag2 = QtWidgets.QGraphicsItem.ItemIsMovable
 
         if globals_.Area is not None:
-            for com in globals_.Area.comments:
-                com.setFlag(flag1, not globals_.CommentsFrozen)
-                com.setFlag(flag2, not globals_.CommentsFrozen)
+            self.SetItemsFrozen(globals_.Area.comments, checked)
 
-        setSetting('FreezeComments', globals_.CommentsFrozen)
-        self.scene.update()
+        setSetting('FreezeComments', checked)
 
     def HandleSwitchGrid(self):
         """
@@ -2836,19 +2587,17 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         Handle zooming in
         """
-        z = self.ZoomLevel
-        zi = self.ZoomLevels.index(z) + 1
+        zi = self.ZoomIndex + 1
         if zi < len(self.ZoomLevels):
-            self.ZoomTo(self.ZoomLevels[zi])
+            self.ZoomTo(self.ZoomLevels[zi], zi)
 
     def HandleZoomOut(self):
         """
         Handle zooming out
         """
-        z = self.ZoomLevel
-        zi = self.ZoomLevels.index(z) - 1
+        zi = self.ZoomIndex - 1
         if zi >= 0:
-            self.ZoomTo(self.ZoomLevels[zi])
+            self.ZoomTo(self.ZoomLevels[zi], zi)
 
     def HandleZoomActual(self):
         """
@@ -2860,25 +2609,28 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         Handle zooming to the minimum size
         """
-        self.ZoomTo(self.ZoomLevels[0])
+        self.ZoomTo(self.ZoomLevels[0], 0)
 
     def HandleZoomMax(self):
         """
         Handle zooming to the maximum size
         """
-        self.ZoomTo(self.ZoomLevels[-1])
+        self.ZoomTo(self.ZoomLevels[-1], len(self.ZoomLevels) - 1)
 
-    def ZoomTo(self, z):
+    def ZoomTo(self, z, zi=None):
         """
-        Zoom to a specific level
+        Zoom to a specific level. zi is its index in ZoomLevels, if known.
         """
+        if zi is None:
+            zi = self.ZoomLevels.index(z)
+
         tr = QtGui.QTransform()
         tr.scale(z / 100.0, z / 100.0)
         self.ZoomLevel = z
+        self.ZoomIndex = zi
         self.view.setTransform(tr)
         self.levelOverview.mainWindowScale = z / 100.0
 
-        zi = self.ZoomLevels.index(z)
         self.actions['zoommax'].setEnabled(zi < len(self.ZoomLevels) - 1)
         self.actions['zoomin'].setEnabled(zi < len(self.ZoomLevels) - 1)
         self.actions['zoomactual'].setEnabled(z != 100.0)
@@ -2889,6 +2641,14 @@ class ReggieWindow(QtWidgets.QMainWindow):
         self.ZoomStatusWidget.setZoomLevel(z)
 
         # Update the zone grabber rects, to resize for the new zoom level
+        self.zoneRectsTimer.start()
+
+    def RefreshZoneRects(self):
+        """
+        Updates the zone rects after the zoom level changed
+        """
+        if globals_.Area is None: return
+
         for z in globals_.Area.zones:
             z.UpdateRects()
 
@@ -2901,17 +2661,20 @@ class ReggieWindow(QtWidgets.QMainWindow):
         self.view.centerOn(x, y)
         self.levelOverview.update()
 
+    # Header of each saved comment: its position and the text length
+    CommentHeader = struct.Struct('>3I')
+
     def SaveComments(self):
         """
         Saves the comments data back to self.Metadata
         """
-        b = b""
+        pack = self.CommentHeader.pack
+        parts = []
         for com in globals_.Area.comments:
-            tlen = len(com.text)
-            b += struct.pack(">3I", com.objx, com.objy, tlen)
-            b += com.text.encode("utf-8")
+            parts.append(pack(com.objx, com.objy, len(com.text)))
+            parts.append(com.text.encode("utf-8"))
 
-        globals_.Area.Metadata.setBinData('InLevelComments_A%d' % globals_.Area.areanum, b)
+        globals_.Area.Metadata.setBinData('InLevelComments_A%d' % globals_.Area.areanum, b"".join(parts))
 
     def closeEvent(self, event):
         """
@@ -2941,8 +2704,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
 
         globals_.gamedef.SetLastLevel(str(self.fileSavePath))
 
-        setSetting('AutoSaveFilePath', None)
-        setSetting('AutoSaveFileData', 'x')
+        self.ClearAutosave(None)
 
         event.accept()
 
@@ -2961,12 +2723,12 @@ class ReggieWindow(QtWidgets.QMainWindow):
         else:
             globals_.levName = os.path.basename(name)
 
-            checknames = []
             if isFullPath:
-                checknames = [name]
+                checknames = (name,)
             else:
-                for ext in globals_.FileExtentions:
-                    checknames.append(os.path.join(globals_.gamedef.GetGamePath(), name + ext))
+                # only build the paths until one of them exists
+                gamePath = globals_.gamedef.GetGamePath()
+                checknames = (os.path.join(gamePath, name + ext) for ext in globals_.FileExtentions)
 
             found = False
             for checkname in checknames:
@@ -2978,7 +2740,9 @@ class ReggieWindow(QtWidgets.QMainWindow):
                                               globals_.trans.string('Err_CantFindLevel', 0, '[name]', checkname),
                                               QtWidgets.QMessageBox.Ok)
                 return False
-            if not IsNSMBLevel(checkname):
+            # this also reads and decompresses the level for us
+            levelData = ReadNSMBLevel(checkname)
+            if levelData is None:
                 QtWidgets.QMessageBox.warning(self, 'Reggie!', globals_.trans.string('Err_InvalidLevel', 0),
                                               QtWidgets.QMessageBox.Ok)
                 return False
@@ -2988,29 +2752,10 @@ class ReggieWindow(QtWidgets.QMainWindow):
             # Get the data
             if not globals_.RestoredFromAutoSave:
 
-                # Check if there is a file by this name
-                if not os.path.isfile(name):
-                    QtWidgets.QMessageBox.warning(None, globals_.trans.string('Err_MissingLevel', 0),
-                                                  globals_.trans.string('Err_MissingLevel', 1, '[file]', name))
-                    return False
-
                 # Set the filepath variables
                 self.fileSavePath = name
                 self.fileTitle = os.path.basename(self.fileSavePath)
 
-                # Open the file
-                with open(self.fileSavePath, 'rb') as fileobj:
-                    levelData = fileobj.read()
-
-                # Decompress, if needed
-                if (levelData[0] & 0xF0) == 0x40:  # If LH-compressed
-                    try:
-                        levelData = lh.UncompressLH(levelData)
-                    except IndexError:
-                        QtWidgets.QMessageBox.warning(None, globals_.trans.string('Err_Decompress', 0),
-                                                      globals_.trans.string('Err_Decompress', 1, '[file]', name))
-                        return False
-
             else:
                 # Auto-saved level. Check if there's a path associated with it:
 
@@ -3021,8 +2766,9 @@ class ReggieWindow(QtWidgets.QMainWindow):
                     self.fileSavePath = globals_.AutoSavePath
                     self.fileTitle = os.path.basename(name)
 
-                # Get the level data
-                levelData = globals_.AutoSaveData
+                # Get the level data; the restored copy isn't needed afterwards
+                levelData = bytes(globals_.AutoSaveData)
+                globals_.AutoSaveData = b''
                 SetDirty(noautosave=True)
 
                 # Turn off the autosave flag
@@ -3035,6 +2781,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         # First, clear out the existing level.
         self.scene.clearSelection()
         self.CurrentSelection = []
+        self.CurrentSelectionIds = None
         self.scene.clear()
 
         # Clear out all level-thing lists
@@ -3075,13 +2822,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         self.levelOverview.update()
 
         # Scroll to the initial entrance
-        startEntID = globals_.Area.startEntrance
-        startEnt = None
-        for ent in globals_.Area.entrances:
-            if ent.entid == startEntID:
-                startEnt = ent
-                break
-
+        startEnt = globals_.Area.GetEntrance(globals_.Area.startEntrance)
         if startEnt is not None:
             self.view.centerOn(startEnt.objx * 1.5, startEnt.objy * 1.5)
         else:
@@ -3108,7 +2849,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         self.UpdateTitle()
 
         # Update UI things
-        self.scene.update(0, 0, self.scene.width(), self.scene.height())
+        self.scene.update()
 
         self.levelOverview.Reset()
         self.levelOverview.update()
@@ -3169,98 +2910,131 @@ class ReggieWindow(QtWidgets.QMainWindow):
         self.LoadEventTabFromLevel()
 
         # Add all things to the scene
+        addItem = self.scene.addItem
+
         pcEvent = self.HandleObjPosChange
-        for layer in reversed(globals_.Area.layers):
-            for obj in layer:
-                obj.positionChanged = pcEvent
-                self.scene.addItem(obj)
+        for obj in chain.from_iterable(reversed(globals_.Area.layers)):
+            obj.positionChanged = pcEvent
+            addItem(obj)
 
         pcEvent = self.HandleSprPosChange
         for spr in globals_.Area.sprites:
             spr.positionChanged = pcEvent
             self.spriteList.addSprite(spr)
-            self.scene.addItem(spr)
+            addItem(spr)
             spr.UpdateListItem()
 
-        pcEvent = self.HandleEntPosChange
-        for ent in globals_.Area.entrances:
-            ent.positionChanged = pcEvent
-            ent.listitem = ListWidgetItem_SortsByOther(ent)
-            ent.listitem.entid = ent.entid
-            self.entranceList.addItem(ent.listitem)
-            self.scene.addItem(ent)
-            ent.UpdateListItem()
-
-        for zone in globals_.Area.zones:
-            self.scene.addItem(zone)
-
-        pcEvent = self.HandleLocPosChange
-        scEvent = self.HandleLocSizeChange
-        for location in globals_.Area.locations:
-            location.positionChanged = pcEvent
-            location.sizeChanged = scEvent
-            location.listitem = ListWidgetItem_SortsByOther(location)
-            self.locationList.addItem(location.listitem)
-            self.scene.addItem(location)
-            location.UpdateListItem()
-
-        for path in globals_.Area.paths:
-            path.positionChanged = self.HandlePathPosChange
-            path.listitem = ListWidgetItem_SortsByOther(path)
-            self.pathList.addItem(path.listitem)
-            self.scene.addItem(path)
-            path.UpdateListItem()
-
-        for path in globals_.Area.pathdata:
-            peline = PathEditorLineItem(path['nodes'])
-            path['peline'] = peline
-            self.scene.addItem(peline)
-            peline.loops = path['loops']
-
-        for path in globals_.Area.paths:
-            path.UpdateListItem()
+        # the sorted lists would re-sort on every added item and every text
+        # change, so sort them once at the end instead
+        sortedLists = (self.entranceList, self.locationList, self.pathList, self.commentList)
+        for thingList in sortedLists:
+            thingList.setSortingEnabled(False)
+            thingList.setUpdatesEnabled(False)
 
-        for com in globals_.Area.comments:
-            com.positionChanged = self.HandleComPosChange
-            com.textChanged = self.HandleComTxtChange
-            com.listitem = QtWidgets.QListWidgetItem()
-            self.commentList.addItem(com.listitem)
-            self.scene.addItem(com)
-            com.UpdateListItem()
+        try:
+            pcEvent = self.HandleEntPosChange
+            for ent in globals_.Area.entrances:
+                ent.positionChanged = pcEvent
+                ent.listitem = ListWidgetItem_SortsByOther(ent)
+                ent.listitem.entid = ent.entid
+                self.entranceList.addItem(ent.listitem)
+                addItem(ent)
+                ent.UpdateListItem()
+
+            for zone in globals_.Area.zones:
+                addItem(zone)
+
+            pcEvent = self.HandleLocPosChange
+            scEvent = self.HandleLocSizeChange
+            for location in globals_.Area.locations:
+                location.positionChanged = pcEvent
+                location.sizeChanged = scEvent
+                location.listitem = ListWidgetItem_SortsByOther(location)
+                self.locationList.addItem(location.listitem)
+                addItem(location)
+                location.UpdateListItem()
+
+            pcEvent = self.HandlePathPosChange
+            for path in globals_.Area.paths:
+                path.positionChanged = pcEvent
+                path.listitem = ListWidgetItem_SortsByOther(path)
+                self.pathList.addItem(path.listitem)
+                addItem(path)
+                path.UpdateListItem()
+
+            for path in globals_.Area.pathdata:
+                peline = PathEditorLineItem(path['nodes'])
+                path['peline'] = peline
+                addItem(peline)
+                peline.loops = path['loops']
+
+            pcEvent = self.HandleComPosChange
+            tcEvent = self.HandleComTxtChange
+            for com in globals_.Area.comments:
+                com.positionChanged = pcEvent
+                com.textChanged = tcEvent
+                com.listitem = QtWidgets.QListWidgetItem()
+                self.commentList.addItem(com.listitem)
+                addItem(com)
+                com.UpdateListItem()
+        finally:
+            for thingList in sortedLists:
+                thingList.setSortingEnabled(True)
+                thingList.sortItems()
+                thingList.setUpdatesEnabled(True)
 
     def OpenPuzzle(self, tilesetIndex = None):
         if not os.path.isfile(globals_.PuzzlePy):
             return
         
+        # a frozen build's executable is Reggie itself, not an interpreter
+        python = 'python' if hasattr(sys, 'frozen') else sys.executable
+        args = [python, globals_.PuzzlePy]
+
         if type(tilesetIndex) == int:
             if self.objAllTab.isTabEnabled(tilesetIndex):
-                tilesets = [globals_.Area.tileset0, globals_.Area.tileset1, globals_.Area.tileset2, globals_.Area.tileset3]
-                tilesetDir = " " + os.path.join(globals_.gamedef.GetGamePath(), "Texture/" + tilesets[tilesetIndex] + ".arc")
+                tilesets = globals_.Area.tilesets
+                args.append(os.path.join(globals_.gamedef.GetGamePath(), "Texture", tilesets[tilesetIndex] + ".arc"))
             else: return
-        else:
-            tilesetDir = ""
-        subprocess.Popen("python " + globals_.PuzzlePy + tilesetDir)
+
+        subprocess.Popen(args)
 
 
     def ReloadTilesets(self, soft=False):
         """
         Reloads all the tilesets. If soft is True, they will not be reloaded if the filepaths have not changed.
         """
+        oldInfo = globals_.TilesetInfo
         LoadTilesetInfo(True)
+        newInfo = globals_.TilesetInfo
 
-        tilesets = [globals_.Area.tileset0, globals_.Area.tileset1, globals_.Area.tileset2, globals_.Area.tileset3]
+        tilesets = globals_.Area.tilesets
+        changedSlots = set()
         for idx, name in enumerate(tilesets):
             if (name is not None) and (name != ''):
-                LoadTileset(idx, name, not soft)
+                if LoadTileset(idx, name, not soft):
+                    changedSlots.add(idx)
+                elif oldInfo is None or oldInfo.get(name) != newInfo.get(name):
+                    # the file is unchanged, but objects are randomised
+                    # differently now
+                    changedSlots.add(idx)
 
         self.objPicker.LoadFromTilesets()
-
-        for layer in globals_.Area.layers:
-            for obj in layer:
-                obj.updateObjCache()
+        self.UpdateObjCachesForSlots(changedSlots)
 
         self.scene.update()
 
+    @staticmethod
+    def UpdateObjCachesForSlots(slots):
+        """
+        Rebuilds the cached tiles of every object using one of the given tileset slots
+        """
+        if not slots: return
+
+        for obj in chain.from_iterable(globals_.Area.layers):
+            if obj.tileset in slots:
+                obj.updateObjCache()
+
     def ReloadSpritedata(self):
         LoadSpriteData()
 
@@ -3276,7 +3050,30 @@ class ReggieWindow(QtWidgets.QMainWindow):
         if search != "":
             self.sprPicker.SetSearchString(search)
 
-    def ChangeSelectionHandler(self):
+    SelectionTypes = (ObjectItem, SpriteItem, EntranceItem, LocationItem, PathItem, CommentItem)
+    SelectionTypeIndex = {}
+    SelectionListTabs = {2: (2, 'entranceList'), 3: (3, 'locationList'), 4: (4, 'pathList'), 5: (7, 'commentList')}
+
+    @classmethod
+    def GetSelectionTypeIndex(cls, itemType):
+        """
+        Returns the index of the selectable type itemType is, or None
+        """
+        try:
+            return cls.SelectionTypeIndex[itemType]
+        except KeyError:
+            pass
+
+        idx = None
+        for i, selType in enumerate(cls.SelectionTypes):
+            if issubclass(itemType, selType):
+                idx = i
+                break
+
+        cls.SelectionTypeIndex[itemType] = idx
+        return idx
+
+    def ChangeSelectionHandler(self, onlyIfChanged=False):
         """
         Update the visible panels whenever the selection changes
         """
@@ -3289,6 +3086,11 @@ class ReggieWindow(QtWidgets.QMainWindow):
             # you get a RuntimeError about the 'underlying C++ object being deleted'
             return
 
+        # CurrentSelection keeps the previous items alive, so their ids can't
+        # be reused by new items
+        selectionIds = frozenset(map(id, selitems))
+        if onlyIfChanged and selectionIds == self.CurrentSelectionIds: return
+
         # do this to avoid flicker
         showSpritePanel = False
         showEntrancePanel = False
@@ -3306,15 +3108,6 @@ class ReggieWindow(QtWidgets.QMainWindow):
         self.pathList.setCurrentItem(None)
         self.commentList.setCurrentItem(None)
 
-        # possibly a small optimization
-        func_ii = isinstance
-        type_obj = ObjectItem
-        type_spr = SpriteItem
-        type_ent = EntranceItem
-        type_loc = LocationItem
-        type_path = PathItem
-        type_com = CommentItem
-
         if len(selitems) == 0:
             # nothing is selected
             self.actions['cut'].setEnabled(False)
@@ -3331,36 +3124,23 @@ class ReggieWindow(QtWidgets.QMainWindow):
 
             item = selitems[0]
             self.selObj = item
-            if func_ii(item, type_spr):
-                showSpritePanel = True
-                updateModeInfo = True
-            elif func_ii(item, type_ent):
-                self.creationTabs.setCurrentIndex(2)
-                self.UpdateFlag = True
-                self.entranceList.setCurrentItem(item.listitem)
-                self.UpdateFlag = False
-                showEntrancePanel = True
-                updateModeInfo = True
-            elif func_ii(item, type_loc):
-                self.creationTabs.setCurrentIndex(3)
-                self.UpdateFlag = True
-                self.locationList.setCurrentItem(item.listitem)
-                self.UpdateFlag = False
-                showLocationPanel = True
-                updateModeInfo = True
-            elif func_ii(item, type_path):
-                self.creationTabs.setCurrentIndex(4)
-                self.UpdateFlag = True
-                self.pathList.setCurrentItem(item.listitem)
-                self.UpdateFlag = False
-                showPathPanel = True
-                updateModeInfo = True
-            elif func_ii(item, type_com):
-                self.creationTabs.setCurrentIndex(7)
-                self.UpdateFlag = True
-                self.commentList.setCurrentItem(item.listitem)
-                self.UpdateFlag = False
+            idx = self.GetSelectionTypeIndex(type(item))
+            if idx:
                 updateModeInfo = True
+                showSpritePanel = idx == 1
+                showEntrancePanel = idx == 2
+                showLocationPanel = idx == 3
+                showPathPanel = idx == 4
+
+                listTab = self.SelectionListTabs.get(idx)
+                if listTab is not None:
+                    tab, listName = listTab
+                    self.creationTabs.setCurrentIndex(tab)
+                    self.UpdateFlag = True
+                    try:
+                        getattr(self, listName).setCurrentItem(item.listitem)
+                    finally:
+                        self.UpdateFlag = False
 
         else:
             updateModeInfo = True
@@ -3371,22 +3151,23 @@ class ReggieWindow(QtWidgets.QMainWindow):
             self.actions['shiftitems'].setEnabled(True)
 
         # turn on the Stamp Add btn if applicable
-        self.stampAddBtn.setEnabled(len(selitems) > 0)
+        if self.stampAddBtn is not None:
+            self.stampAddBtn.setEnabled(len(selitems) > 0)
 
         # count the # of each type, for the statusbar label
-        spr = 0
-        ent = 0
-        obj = 0
-        loc = 0
-        path = 0
-        com = 0
+        counts = [0] * len(self.SelectionTypes)
+        typeIndex = self.SelectionTypeIndex
         for item in selitems:
-            if func_ii(item, type_spr): spr += 1
-            if func_ii(item, type_ent): ent += 1
-            if func_ii(item, type_obj): obj += 1
-            if func_ii(item, type_loc): loc += 1
-            if func_ii(item, type_path): path += 1
-            if func_ii(item, type_com): com += 1
+            itemType = type(item)
+            try:
+                idx = typeIndex[itemType]
+            except KeyError:
+                idx = self.GetSelectionTypeIndex(itemType)
+
+            if idx is not None:
+                counts[idx] += 1
+
+        obj, spr, ent, loc, path, com = counts
 
         if loc >= 2:
             self.actions['mergelocations'].setEnabled(True)
@@ -3394,35 +3175,45 @@ class ReggieWindow(QtWidgets.QMainWindow):
         # write the statusbar label text
         text = ''
         if len(selitems) > 0:
+            # strings without replacements are cached by the translation, so
+            # only the count has to be substituted here
+            trans = globals_.trans
+
+            def statusString(code):
+                return trans.string('Statusbar', code)
+
+            def countString(code, count):
+                return trans.string('Statusbar', code).replace('[x]', str(count))
+
             singleitem = len(selitems) == 1
             if singleitem:
                 if obj:
-                    text = globals_.trans.string('Statusbar', 0)  # 1 object selected
+                    text = statusString(0)  # 1 object selected
                 elif spr:
-                    text = globals_.trans.string('Statusbar', 1)  # 1 sprite selected
+                    text = statusString(1)  # 1 sprite selected
                 elif ent:
-                    text = globals_.trans.string('Statusbar', 2)  # 1 entrance selected
+                    text = statusString(2)  # 1 entrance selected
                 elif loc:
-                    text = globals_.trans.string('Statusbar', 3)  # 1 location selected
+                    text = statusString(3)  # 1 location selected
                 elif path:
-                    text = globals_.trans.string('Statusbar', 4)  # 1 path node selected
+                    text = statusString(4)  # 1 path node selected
                 else:
-                    text = globals_.trans.string('Statusbar', 29)  # 1 comment selected
+                    text = statusString(29)  # 1 comment selected
             else:  # multiple things selected; see if they're all the same type
                 if not any((spr, ent, loc, path, com)):
-                    text = globals_.trans.string('Statusbar', 5, '[x]', obj)  # x objects selected
+                    text = countString(5, obj)  # x objects selected
                 elif not any((obj, ent, loc, path, com)):
-                    text = globals_.trans.string('Statusbar', 6, '[x]', spr)  # x sprites selected
+                    text = countString(6, spr)  # x sprites selected
                 elif not any((obj, spr, loc, path, com)):
-                    text = globals_.trans.string('Statusbar', 7, '[x]', ent)  # x entrances selected
+                    text = countString(7, ent)  # x entrances selected
                 elif not any((obj, spr, ent, path, com)):
-                    text = globals_.trans.string('Statusbar', 8, '[x]', loc)  # x locations selected
+                    text = countString(8, loc)  # x locations selected
                 elif not any((obj, spr, ent, loc, com)):
-                    text = globals_.trans.string('Statusbar', 9, '[x]', path)  # x path nodes selected
+                    text = countString(9, path)  # x path nodes selected
                 elif not any((obj, spr, ent, path, loc)):
-                    text = globals_.trans.string('Statusbar', 30, '[x]', com)  # x comments selected
+                    text = countString(30, com)  # x comments selected
                 else:  # different types
-                    text = globals_.trans.string('Statusbar', 10, '[x]', len(selitems))  # x items selected
+                    text = countString(10, len(selitems))  # x items selected
                     types = (
                         (obj, 12, 13),  # variable, translation string ID if var == 1, translation string ID if var > 1
                         (spr, 14, 15),
@@ -3434,21 +3225,23 @@ class ReggieWindow(QtWidgets.QMainWindow):
                     first = True
                     for var, singleCode, multiCode in types:
                         if var > 0:
-                            if not first: text += globals_.trans.string('Statusbar', 11)
+                            if not first: text += statusString(11)
                             first = False
-                            text += globals_.trans.string('Statusbar', (singleCode if var == 1 else multiCode), '[x]', var)
-                            # above: '[x]', var) can't hurt if var == 1
+                            text += countString(singleCode if var == 1 else multiCode, var)
 
-                    text += globals_.trans.string('Statusbar', 22)  # ')'
+                    text += statusString(22)  # ')'
         self.selectionLabel.setText(text)
 
         self.CurrentSelection = selitems
+        self.CurrentSelectionIds = selectionIds
 
-        for thing in selitems:
-            # This helps sync non-objects with objects while dragging
-            if not isinstance(thing, ObjectItem):
-                thing.dragoffsetx = (((thing.objx // 16) * 16) - thing.objx) * 1.5
-                thing.dragoffsety = (((thing.objy // 16) * 16) - thing.objy) * 1.5
+        # This helps sync non-objects with objects while dragging
+        # (the offset back to the 16-pixel grid is -(pos % 16))
+        if obj != len(selitems):
+            for thing in selitems:
+                if not isinstance(thing, ObjectItem):
+                    thing.dragoffsetx = (thing.objx % 16) * -1.5
+                    thing.dragoffsety = (thing.objy % 16) * -1.5
 
         self.spriteEditorDock.setVisible(showSpritePanel)
         self.entranceEditorDock.setVisible(showEntrancePanel)
@@ -3472,17 +3265,23 @@ class ReggieWindow(QtWidgets.QMainWindow):
         if obj == self.selObj:
             if oldx == x and oldy == y: return
             SetDirty()
-        self.levelOverview.update()
+        self.overviewUpdateTimer.start()
 
     def CreationTabChanged(self, nt):
         """
         Handles the selected palette tab changing
         """
+        builder = self.creationTabBuilders.pop(nt, None)
+        if builder is not None:
+            builder()
+
         CPT = -1
 
         if nt == 0:  # objects
             CPT = self.objAllTab.currentIndex()
         elif nt == 1:  # sprites
+            self.LoadSpritePicker()
+
             # Ensure the user can't paint sprites
             # when the 'current sprites' tab is
             # opened.
@@ -3501,6 +3300,19 @@ class ReggieWindow(QtWidgets.QMainWindow):
 
         globals_.CurrentPaintType = CPT
 
+    def LoadSpritePicker(self):
+        """
+        Fills the sprite view picker and the sprite picker, unless this has
+        already been done
+        """
+        if self.spriteViewPicker.count() != 0: return
+
+        LoadSpriteCategories()
+        for view in globals_.SpriteCategories:
+            self.spriteViewPicker.addItem(view[0])
+
+        self.sprPicker.LoadItems()
+
     def ObjTabChanged(self, nt):
         """
         Handles the selected slot tab in the object palette changing
@@ -3508,7 +3320,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         if hasattr(self, 'objPicker'):
             if 0 <= nt <= 3:
                 self.objPicker.ShowTileset(nt)
-                eval('self.objTS%dTab' % nt).setLayout(self.createObjectLayout)
+                self.objTSTabs[nt].setLayout(self.createObjectLayout)
             self.defaultPropDock.setVisible(False)
 
         globals_.CurrentPaintType = nt
@@ -3546,11 +3358,11 @@ class ReggieWindow(QtWidgets.QMainWindow):
                 newLayer = area.layers[2]
 
             for x in items:
-                if isinstance(x, type_obj) and x.layer != nl:
+                if x.__class__ is type_obj and x.layer != nl:
                     change.append(x)
 
             if len(change) > 0:
-                change.sort(key=lambda x: x.zValue())
+                change.sort(key=methodcaller('zValue'))
 
                 if len(newLayer) == 0:
                     z = (2 - nl) * 8192
@@ -3564,15 +3376,21 @@ class ReggieWindow(QtWidgets.QMainWindow):
                 else:
                     newVisibility = globals_.Layer2Shown
 
-                for item in change:
-                    area.RemoveFromLayer(item)
-                    item.layer = nl
-                    newLayer.append(item)
-                    item.setZValue(z)
-                    item.setVisible(newVisibility)
-                    item.update()
-                    item.UpdateTooltip()
-                    z += 1
+                # the scene is repainted once below, so don't let the view
+                # repaint for each item
+                self.view.setUpdatesEnabled(False)
+                try:
+                    for item in change:
+                        area.RemoveFromLayer(item)
+                        item.layer = nl
+                        newLayer.append(item)
+                        item.setZValue(z)
+                        item.setVisible(newVisibility)
+                        item.UpdateTooltip()
+                        self.scene.invalidateObjects(item.TileRect)
+                        z += 1
+                finally:
+                    self.view.setUpdatesEnabled(True)
 
             self.scene.update()
             SetDirty()
@@ -3594,7 +3412,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         changed = False
 
         for x in items:
-            if isinstance(x, type_obj) and (x.tileset != tileset or x.type != type):
+            if x.__class__ is type_obj and (x.tileset != tileset or x.type != type):
                 x.SetType(tileset, type)
                 x.update()
                 changed = True
@@ -3627,7 +3445,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         changed = False
 
         for x in items:
-            if isinstance(x, type_spr):
+            if x.__class__ is type_spr:
                 x.spritedata = self.defaultDataEditor.data  # change this first or else images get messed up
                 x.SetType(type)
                 x.update()
@@ -3699,7 +3517,6 @@ class ReggieWindow(QtWidgets.QMainWindow):
         if oldx == x and oldy == y: return
         obj.updatePos()
         obj.pathinfo['peline'].nodePosChanged()
-        obj.UpdateListItem()
         if obj == self.selObj:
             SetDirty()
 
@@ -3712,7 +3529,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         obj.handlePosChange(oldx, oldy)
         obj.UpdateListItem()
         if obj == self.selObj:
-            self.SaveComments()
+            self.commentSaveTimer.start()
             SetDirty()
 
     def HandleComTxtChange(self, obj):
@@ -3724,17 +3541,29 @@ class ReggieWindow(QtWidgets.QMainWindow):
         self.SaveComments()
         SetDirty()
 
+    @staticmethod
+    def FindListItemOwner(item, objects):
+        """
+        Returns the object in objects that a list item belongs to, or None
+        """
+        # most list items keep a reference to their object
+        owner = getattr(item, 'reference', None)
+        if owner is not None:
+            return owner
+
+        for check in objects:
+            if check.listitem == item:
+                return check
+
+        return None
+
     def HandleEntranceSelectByList(self, item):
         """
         Handle an entrance being selected from the list
         """
         if self.UpdateFlag: return
 
-        ent = None
-        for check in globals_.Area.entrances:
-            if check.listitem == item:
-                ent = check
-                break
+        ent = self.FindListItemOwner(item, globals_.Area.entrances)
         if ent is None: return
 
         ent.ensureVisible(QtCore.QRectF(), 192, 192)
@@ -3745,11 +3574,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         Handle an entrance being hovered in the list
         """
-        ent = None
-        for check in globals_.Area.entrances:
-            if check.listitem == item:
-                ent = check
-                break
+        ent = self.FindListItemOwner(item, globals_.Area.entrances)
         if ent is None: return
 
         ent.UpdateListItem(True)
@@ -3760,11 +3585,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         if self.UpdateFlag: return
 
-        loc = None
-        for check in globals_.Area.locations:
-            if check.listitem == item:
-                loc = check
-                break
+        loc = self.FindListItemOwner(item, globals_.Area.locations)
         if loc is None: return
 
         loc.ensureVisible(QtCore.QRectF(), 192, 192)
@@ -3775,11 +3596,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         Handle a location being hovered in the list
         """
-        loc = None
-        for check in globals_.Area.locations:
-            if check.listitem == item:
-                loc = check
-                break
+        loc = self.FindListItemOwner(item, globals_.Area.locations)
         if loc is None: return
 
         loc.UpdateListItem(True)
@@ -3816,11 +3633,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         Handle a path node being selected
         """
-        path = None
-        for check in globals_.Area.paths:
-            if check.listitem == item:
-                path = check
-                break
+        path = self.FindListItemOwner(item, globals_.Area.paths)
         if path is None: return
 
         path.ensureVisible(QtCore.QRectF(), 192, 192)
@@ -3831,11 +3644,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         Handle a path node being hovered in the list
         """
-        path = None
-        for check in globals_.Area.paths:
-            if check.listitem == item:
-                path = check
-                break
+        path = self.FindListItemOwner(item, globals_.Area.paths)
         if path is None: return
 
         path.UpdateListItem(True)
@@ -3844,11 +3653,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         Handle a comment being selected
         """
-        comment = None
-        for check in globals_.Area.comments:
-            if check.listitem == item:
-                comment = check
-                break
+        comment = self.FindListItemOwner(item, globals_.Area.comments)
         if comment is None: return
 
         comment.ensureVisible(QtCore.QRectF(), 192, 192)
@@ -3859,11 +3664,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
         """
         Handle a comment being hovered in the list
         """
-        comment = None
-        for check in globals_.Area.comments:
-            if check.listitem == item:
-                comment = check
-                break
+        comment = self.FindListItemOwner(item, globals_.Area.comments)
         if comment is None: return
 
         comment.UpdateListItem(True)
@@ -3877,7 +3678,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
             self.locationEditor.setLocation(loc)
             SetDirty()
         loc.UpdateListItem()
-        self.levelOverview.update()
+        self.overviewUpdateTimer.start()
 
     def HandleLocSizeChange(self, loc, width, height):
         """
@@ -3887,7 +3688,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
             self.locationEditor.setLocation(loc)
             SetDirty()
         loc.UpdateListItem()
-        self.levelOverview.update()
+        self.overviewUpdateTimer.start()
 
     def UpdateModeInfo(self):
         """
@@ -3911,6 +3712,13 @@ class ReggieWindow(QtWidgets.QMainWindow):
 
         self.UpdateFlag = False
 
+    def QueuePositionHovered(self, x, y):
+        """
+        Remembers the hovered position and schedules a status bar update
+        """
+        self.hoverPos = (x, y)
+        self.positionHoverTimer.start()
+
     def PositionHovered(self, x, y):
         """
         Handle a position being hovered in the view
@@ -3918,11 +3726,9 @@ class ReggieWindow(QtWidgets.QMainWindow):
         info = ''
         hovereditems = self.scene.items(QtCore.QPointF(x, y))
         hovered = None
-        type_zone = ZoneItem
-        type_peline = PathEditorLineItem
+        skip = (ZoneItem, PathEditorLineItem)
         for item in hovereditems:
-            hover = item.hover if hasattr(item, 'hover') else True
-            if (not isinstance(item, type_zone)) and (not isinstance(item, type_peline)) and hover:
+            if not isinstance(item, skip) and getattr(item, 'hover', True):
                 hovered = item
                 break
 
@@ -3963,17 +3769,20 @@ class ReggieWindow(QtWidgets.QMainWindow):
             sel = self.scene.selectedItems()
             if len(sel) > 0:
                 self.SelectionUpdateFlag = True
-                for obj in sel:
-                    obj.delete()
-                    obj.setSelected(False)
-                    self.scene.removeItem(obj)
-                    self.levelOverview.update()
+                self.scene.blockSignals(True)
+                try:
+                    self.scene.clearSelection()
+                    for obj in sel:
+                        obj.delete()
+                        self.scene.removeItem(obj)
+                finally:
+                    self.scene.blockSignals(False)
+                    self.SelectionUpdateFlag = False
                 SetDirty()
+                self.levelOverview.update()
                 event.accept()
-                self.SelectionUpdateFlag = False
                 self.ChangeSelectionHandler()
                 return
-        self.levelOverview.update()
 
         QtWidgets.QMainWindow.keyPressEvent(self, event)
 
@@ -3996,19 +3805,23 @@ class ReggieWindow(QtWidgets.QMainWindow):
             globals_.Area.unkVal1 = dlg.LoadingTab.unk3.value()
             globals_.Area.unkVal2 = dlg.LoadingTab.unk4.value()
 
-            oldnames = [globals_.Area.tileset0, globals_.Area.tileset1, globals_.Area.tileset2, globals_.Area.tileset3]
-            assignments = ['globals_.Area.tileset0', 'globals_.Area.tileset1', 'globals_.Area.tileset2', 'globals_.Area.tileset3']
+            attrs = ('tileset0', 'tileset1', 'tileset2', 'tileset3')
             newnames = dlg.TilesetsTab.values()
 
-            for idx, oldname, assignment, fname in zip(range(4), oldnames, assignments, newnames):
+            customMarker = globals_.trans.string('AreaDlg', 16)
+            customPrefixLen = len(globals_.trans.string('AreaDlg', 17, '[name]', ''))
+
+            changedSlots = set()
+            for idx, attr, fname in zip(range(4), attrs, newnames):
 
                 if fname in ('', None):
                     fname = ''
-                elif fname.startswith(globals_.trans.string('AreaDlg', 16)):
-                    fname = fname[len(globals_.trans.string('AreaDlg', 17, '[name]', '')):]
+                elif fname.startswith(customMarker):
+                    fname = fname[customPrefixLen:]
 
-                # TODO: Remove this exec
-                exec(assignment + ' = fname')
+                if getattr(globals_.Area, attr) != fname:
+                    changedSlots.add(idx)
+                setattr(globals_.Area, attr, fname)
 
                 if fname != '':
                     LoadTileset(idx, fname)
@@ -4022,9 +3835,7 @@ class ReggieWindow(QtWidgets.QMainWindow):
             self.objAllTab.setTabEnabled(2, (globals_.Area.tileset2 != ''))
             self.objAllTab.setTabEnabled(3, (globals_.Area.tileset3 != ''))
 
-            for layer in globals_.Area.layers:
-                for obj in layer:
-                    obj.updateObjCache()
+            self.UpdateObjCachesForSlots(changedSlots)
 
             self.scene.update()
 
@@ -4035,53 +3846,37 @@ class ReggieWindow(QtWidgets.QMainWindow):
         dlg = ZonesDialog()
         if dlg.exec_() == QtWidgets.QDialog.Accepted:
             SetDirty()
-            i = 0
 
             # resync the zones
-            items = self.scene.items()
-            func_ii = isinstance
-            type_zone = ZoneItem
-
-            for item in items:
-                if func_ii(item, type_zone):
-                    self.scene.removeItem(item)
+            removeItem = self.scene.removeItem
+            for z in globals_.Area.zones:
+                removeItem(z)
 
             globals_.Area.zones = []
 
-            for tab in dlg.zoneTabs:
+            addItem = self.scene.addItem
+            for i, tab in enumerate(dlg.zoneTabs):
                 z = tab.zoneObj
                 z.id = i
                 z.UpdateTitle()
                 globals_.Area.zones.append(z)
-                self.scene.addItem(z)
-
-                if tab.Zone_xpos.value() < 16:
-                    z.objx = 16
-                elif tab.Zone_xpos.value() > 24560:
-                    z.objx = 24560
-                else:
-                    z.objx = tab.Zone_xpos.value()
-
-                if tab.Zone_ypos.value() < 16:
-                    z.objy = 16
-                elif tab.Zone_ypos.value() > 12272:
-                    z.objy = 12272
-                else:
-                    z.objy = tab.Zone_ypos.value()
-
-                if (tab.Zone_width.value() + tab.Zone_xpos.value()) > 24560:
-                    z.width = 24560 - tab.Zone_xpos.value()
-                else:
-                    z.width = tab.Zone_width.value()
-
-                if (tab.Zone_height.value() + tab.Zone_ypos.value()) > 12272:
-                    z.height = 12272 - tab.Zone_ypos.value()
-                else:
-                    z.height = tab.Zone_height.value()
+                addItem(z)
+
+                xpos = tab.Zone_xpos.value()
+                ypos = tab.Zone_ypos.value()
+                geometry = (
+                    min(max(xpos, 16), 24560),
+                    min(max(ypos, 16), 12272),
+                    min(tab.Zone_width.value(), 24560 - xpos),
+                    min(tab.Zone_height.value(), 12272 - ypos),
+                )
 
-                z.prepareGeometryChange()
-                z.UpdateRects()
-                z.setPos(z.objx * 1.5, z.objy * 1.5)
+                # only invalidate the zone's area in the scene if it moved or was resized
+                if geometry != (z.objx, z.objy, z.width, z.height):
+                    z.objx, z.objy, z.width, z.height = geometry
+                    z.prepareGeometryChange()
+                    z.UpdateRects()
+                    z.setPos(z.objx * 1.5, z.objy * 1.5)
 
                 z.modeldark = tab.Zone_modeldark.currentIndex()
                 z.terraindark = tab.Zone_terraindark.currentIndex()
@@ -4089,38 +3884,28 @@ class ReggieWindow(QtWidgets.QMainWindow):
                 z.camzoom = tab.Zone_screenheights.currentIndex()
                 z.camtrack = tab.Zone_direction.currentIndex()
 
-                if tab.Zone_yrestrict.isChecked():
-                    z.mpcamzoomadjust = tab.Zone_mpzoomadjust.value()
-                else:
-                    z.mpcamzoomadjust = 15
+                z.mpcamzoomadjust = tab.Zone_mpzoomadjust.value() if tab.Zone_yrestrict.isChecked() else 15
 
-                if tab.Zone_vnormal.isChecked():
-                    z.visibility = 0
-                    z.visibility = z.visibility + tab.Zone_visibility.currentIndex()
                 if tab.Zone_vspotlight.isChecked():
-                    z.visibility = 16
-                    z.visibility = z.visibility + tab.Zone_visibility.currentIndex()
-                if tab.Zone_vfulldark.isChecked():
-                    z.visibility = 32
-                    z.visibility = z.visibility + tab.Zone_visibility.currentIndex()
-
-                z.yupperbound = tab.Zone_yboundup.value()
-                z.ylowerbound = tab.Zone_ybounddown.value()
-                z.yupperbound2 = tab.Zone_yboundup2.value()
-                z.ylowerbound2 = tab.Zone_ybounddown2.value()
-                z.yupperbound3 = tab.Zone_yboundup3.value()
-                z.ylowerbound3 = tab.Zone_ybounddown3.value()
+                    visibility = 16
+                elif tab.Zone_vfulldark.isChecked():
+                    visibility = 32
+                else:
+                    visibility = 0
+                z.visibility = visibility + tab.Zone_visibility.currentIndex()
+
+                z.yupperbound, z.ylowerbound, z.yupperbound2, z.ylowerbound2, z.yupperbound3, z.ylowerbound3 = (
+                    tab.Zone_yboundup.value(), tab.Zone_ybounddown.value(),
+                    tab.Zone_yboundup2.value(), tab.Zone_ybounddown2.value(),
+                    tab.Zone_yboundup3.value(), tab.Zone_ybounddown3.value(),
+                )
 
                 z.music = tab.Zone_musicid.value()
-                z.sfxmod = tab.Zone_sfx.currentIndex() << 4
-                if tab.Zone_boss.isChecked():
-                    z.sfxmod |= 1
+                z.sfxmod = (tab.Zone_sfx.currentIndex() << 4) | tab.Zone_boss.isChecked()
 
                 z.time100sfx = tab.Zone_hurryUpSfx.currentIndex()
                 z.time100sfx += tab.Zone_slowDownSfx.currentIndex() * 16
 
-                i += 1
-
             self.actions['backgrounds'].setEnabled(len(globals_.Area.zones) > 0)
 
         self.levelOverview.update()
@@ -4138,26 +3923,21 @@ class ReggieWindow(QtWidgets.QMainWindow):
         for tab, z in zip(dlg.BGTabs, globals_.Area.zones):
             # first index: BGA/BGB
             # second index: X/Y
-            z.XpositionA = tab.pos_boxes[0][0].value()
-            z.YpositionA = -tab.pos_boxes[0][1].value()
-            z.XpositionB = tab.pos_boxes[1][0].value()
-            z.YpositionB = -tab.pos_boxes[1][1].value()
+            (posXA, posYA), (posXB, posYB) = tab.pos_boxes
+            (scrollXA, scrollYA), (scrollXB, scrollYB) = tab.scroll_boxes
+            zoomA, zoomB = tab.zoom_boxes
+            (bg1A, bg2A, bg3A), (bg1B, bg2B, bg3B) = tab.hex_boxes
 
-            z.XscrollA = tab.scroll_boxes[0][0].currentIndex()
-            z.YscrollA = tab.scroll_boxes[0][1].currentIndex()
-            z.XscrollB = tab.scroll_boxes[1][0].currentIndex()
-            z.YscrollB = tab.scroll_boxes[1][1].currentIndex()
+            z.XpositionA, z.YpositionA = posXA.value(), -posYA.value()
+            z.XpositionB, z.YpositionB = posXB.value(), -posYB.value()
 
-            z.ZoomA = tab.zoom_boxes[0].currentIndex()
-            z.ZoomB = tab.zoom_boxes[1].currentIndex()
+            z.XscrollA, z.YscrollA = scrollXA.currentIndex(), scrollYA.currentIndex()
+            z.XscrollB, z.YscrollB = scrollXB.currentIndex(), scrollYB.currentIndex()
 
-            z.bg1A = tab.hex_boxes[0][0].value()
-            z.bg2A = tab.hex_boxes[0][1].value()
-            z.bg3A = tab.hex_boxes[0][2].value()
+            z.ZoomA, z.ZoomB = zoomA.currentIndex(), zoomB.currentIndex()
 
-            z.bg1B = tab.hex_boxes[1][0].value()
-            z.bg2B = tab.hex_boxes[1][1].value()
-            z.bg3B = tab.hex_boxes[1][2].value()
+            z.bg1A, z.bg2A, z.bg3A = bg1A.value(), bg2A.value(), bg3A.value()
+            z.bg1B, z.bg2B, z.bg3B = bg1B.value(), bg2B.value(), bg3B.value()
 
     def HandleScreenshot(self):
         """
@@ -4183,20 +3963,14 @@ class ReggieWindow(QtWidgets.QMainWindow):
                                                     QtCore.QSize(globals_.mainWindow.view.width(), globals_.mainWindow.view.height())))
                 RenderPainter.end()
             elif dlg.zoneCombo.currentIndex() == 1:
-                maxX = maxY = 0
-                minX = minY = 0x0ddba11
-                for z in globals_.Area.zones:
-                    if maxX < ((z.objx * 1.5) + (z.width * 1.5)):
-                        maxX = ((z.objx * 1.5) + (z.width * 1.5))
-                    if maxY < ((z.objy * 1.5) + (z.height * 1.5)):
-                        maxY = ((z.objy * 1.5) + (z.height * 1.5))
-                    if minX > z.objx * 1.5:
-                        minX = z.objx * 1.5
-                    if minY > z.objy * 1.5:
-                        minY = z.objy * 1.5
-                maxX = (1024 * 24 if 1024 * 24 < maxX + 40 else maxX + 40)
-                maxY = (512 * 24 if 512 * 24 < maxY + 40 else maxY + 40)
-                minX = (0 if 40 > minX else minX - 40)
+                zones = globals_.Area.zones
+                maxX = max((z.objx + z.width for z in zones), default=0) * 1.5
+                maxY = max((z.objy + z.height for z in zones), default=0) * 1.5
+                minX = min((z.objx for z in zones), default=0) * 1.5
+                minY = min((z.objy for z in zones), default=0) * 1.5
+                maxX = min(maxX + 40, 1024 * 24)
+                maxY = min(maxY + 40, 512 * 24)
+                minX = max(minX - 40, 0)
                 minY = (40 if 40 > minY else minY - 40)
 
                 ScreenshotImage = QtGui.QImage(int(maxX - minX), int(maxY - minY), QtGui.QImage.Format_ARGB32)
@@ -4220,7 +3994,10 @@ class ReggieWindow(QtWidgets.QMainWindow):
                                                       globals_.Area.zones[i].width * 1.5, globals_.Area.zones[i].height * 1.5))
                 RenderPainter.end()
 
-            ScreenshotImage.save(fn, 'PNG', 50)
+            # full-level captures are huge, so favour a fast save over a small file
+            writer = QtGui.QImageWriter(fn, b'PNG')
+            writer.setCompression(1)
+            writer.write(ScreenshotImage)
 
     @staticmethod
     def HandleDiagnostics():
@@ -4231,6 +4008,29 @@ class ReggieWindow(QtWidgets.QMainWindow):
         dlg.exec_()
 
 
+# Settings copied into globals_ at startup: (global name, setting name, default)
+StartupSettings = (
+    ('CollisionsShown', 'ShowCollisions', False),
+    ('RealViewEnabled', 'RealViewEnabled', True),
+    ('ObjectsFrozen', 'FreezeObjects', False),
+    ('SpritesFrozen', 'FreezeSprites', False),
+    ('EntrancesFrozen', 'FreezeEntrances', False),
+    ('LocationsFrozen', 'FreezeLocations', False),
+    ('PathsFrozen', 'FreezePaths', False),
+    ('CommentsFrozen', 'FreezeComments', False),
+    ('SpritesShown', 'ShowSprites', True),
+    ('SpriteImagesShown', 'ShowSpriteImages', True),
+    ('LocationsShown', 'ShowLocations', True),
+    ('CommentsShown', 'ShowComments', True),
+    ('PathsShown', 'ShowPaths', True),
+    ('DrawEntIndicators', 'ZoneEntIndicators', False),
+    ('ResetDataWhenHiding', 'ResetDataWhenHiding', False),
+    ('HideResetSpritedata', 'HideResetSpritedata', False),
+    ('EnablePadding', 'EnablePadding', False),
+    ('PuzzlePy', 'PuzzlePy', ''),
+)
+
+
 def main():
     """
     Main startup function for Reggie
@@ -4263,11 +4063,6 @@ def main():
     # Load the style
     GetDefaultStyle()
 
-    # go to the script path
-    path = module_path()
-    if path is not None:
-        os.chdir(module_path())
-
     # Check if required files are missing
     if FilesAreMissing():
         sys.exit(1)
@@ -4282,8 +4077,6 @@ def main():
     LoadConstantLists()
     LoadTilesetNames()
     LoadObjDescriptions()
-    LoadBgANames()
-    LoadBgBNames()
     LoadSpriteData()
     LoadSpriteListData()
     LoadEntranceNames()
@@ -4311,25 +4104,10 @@ def main():
     else:
         globals_.GridType = None
 
-    globals_.CollisionsShown = setting('ShowCollisions', False)
-    globals_.RealViewEnabled = setting('RealViewEnabled', True)
-    globals_.ObjectsFrozen = setting('FreezeObjects', False)
-    globals_.SpritesFrozen = setting('FreezeSprites', False)
-    globals_.EntrancesFrozen  = setting('FreezeEntrances', False)
-    globals_.LocationsFrozen = setting('FreezeLocations', False)
-    globals_.PathsFrozen = setting('FreezePaths', False)
-    globals_.CommentsFrozen = setting('FreezeComments', False)
-    globals_.SpritesShown = setting('ShowSprites', True)
-    globals_.SpriteImagesShown = setting('ShowSpriteImages', True)
-    globals_.LocationsShown = setting('ShowLocations', True)
-    globals_.CommentsShown = setting('ShowComments', True)
-    globals_.PathsShown = setting('ShowPaths', True)
-    globals_.DrawEntIndicators = setting('ZoneEntIndicators', False)
-    globals_.ResetDataWhenHiding = setting('ResetDataWhenHiding', False)
-    globals_.HideResetSpritedata = setting('HideResetSpritedata', False)
-    globals_.EnablePadding = setting('EnablePadding', False)
+    for name, key, default in StartupSettings:
+        setattr(globals_, name, setting(key, default))
+
     globals_.PaddingLength = int(setting('PaddingLength', 0))
-    globals_.PuzzlePy = setting('PuzzlePy', '')
     SLib.RealViewEnabled = globals_.RealViewEnabled
 
     # Choose a folder for the game
@@ -4357,7 +4135,7 @@ def main():
             # global globals_.RestoredFromAutoSave, globals_.AutoSavePath, globals_.AutoSaveData
             globals_.RestoredFromAutoSave = True
             globals_.AutoSavePath = autofile
-            globals_.AutoSaveData = bytes(autofiledata)
+            globals_.AutoSaveData = autofiledata
         else:
             setSetting('AutoSaveFilePath', None)
             setSetting('AutoSaveFileData', 'x')
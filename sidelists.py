@@ -5,7 +5,7 @@ from PyQt5 import QtWidgets, QtGui, QtCore
 import globals_
 from tiles import RenderObject, TilesetTile
 from ui import ListWidgetWithToolTipSignal
-from misc import LoadSpriteData, LoadSpriteListData, LoadSpriteCategories
+from misc import LoadSpriteData, LoadSpriteListData
 from spriteeditor import SpriteEditorWidget
 
 class LevelOverviewWidget(QtWidgets.QWidget):
@@ -454,6 +454,15 @@ class StampChooserWidget(QtWidgets.QListView):
         """
         self.model.removeStamp(stamp)
 
+    def stampChanged(self, stamp):
+        """
+        Redraws a stamp whose icon has changed
+        """
+        self.model.stampChanged(stamp)
+
+        # the icon size may have changed, so the items need a new layout
+        self.scheduleDelayedItemsLayout()
+
     def currentlySelectedStamp(self):
         """
         Returns the currently selected stamp
@@ -540,6 +549,13 @@ class StampListModel(QtCore.QAbstractListModel):
         # Finish resetting
         self.endResetModel()
 
+    def stampChanged(self, stamp):
+        """
+        Notifies the views that a stamp has changed
+        """
+        index = self.index(self.items.index(stamp))
+        self.dataChanged.emit(index, index, [QtCore.Qt.DecorationRole, QtCore.Qt.UserRole])
+
     def removeStamp(self, stamp):
         """
         Removes a stamp
@@ -766,8 +782,8 @@ class SpritePickerWidget(QtWidgets.QTreeWidget):
 
         LoadSpriteData()
         LoadSpriteListData()
-        LoadSpriteCategories()
-        self.LoadItems()
+
+        # the items are loaded when the sprite palette is first shown
 
     def UpdateSpriteNames(self):
         """
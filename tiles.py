@@ -1068,6 +1068,8 @@ def _LoadTileset(idx, name, reload_=False):
     # Add Tiles to spritelib
     SLib.Tiles = globals_.Tiles
 
+    return True
+
 
 def LoadTexture_NSMBW(tiledata):
     data = tpl.decodeRGB4A3(tiledata, 1024, 256, False)
@@ -1081,7 +1083,7 @@ def IncrementTilesetFrame():
     """
     if not globals_.TilesetsAnimating: return
     for tile in globals_.Tiles:
-        if tile is not None: tile.nextFrame()
+        if tile is not None and tile.isAnimated: tile.nextFrame()
     globals_.mainWindow.scene.update()
     globals_.mainWindow.objPicker.update()
 
@@ -34,6 +34,9 @@ class ReggieTranslation:
         except Exception:
             self.InitAsEnglish()
 
+        # Strings without replacements, mapped to their formatted versions
+        self.stringCache = {}
+
     def InitAsEnglish(self):
         """
         Initializes the ReggieTranslation as the English translation
@@ -1018,6 +1021,10 @@ class ReggieTranslation:
         """
         Gets a string from the translation and returns it
         """
+        # Most strings are requested without any replacements, and the
+        # result is always the same for those
+        if len(args) == 2 and args in self.stringCache:
+            return self.stringCache[args]
 
         # Get the string
         astring = self.strings[args[0]][args[1]]
@@ -1051,6 +1058,9 @@ class ReggieTranslation:
         for old in replace:
             astring = astring.replace(old, replace[old])
 
+        if len(args) == 2:
+            self.stringCache[args] = astring
+
         # Return it
         return astring
 
@@ -296,12 +296,13 @@ class ReggieTheme:
 
         cache = self.iconCacheLg if big else self.iconCacheSm
 
-        if name not in cache:
+        icon = cache.get(name)
+        if icon is None:
             path = 'reggiedata/ico/lg/icon-' if big else 'reggiedata/ico/sm/icon-'
             path += name
-            cache[name] = QtGui.QIcon(path)
+            icon = cache[name] = QtGui.QIcon(path)
 
-        return cache[name]
+        return icon
 
 
 # Related functions
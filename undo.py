@@ -116,33 +116,38 @@ class MoveItemUndoAction(UndoAction):
         """
         Initializes the undo action
         """
-        defType = target.instanceDef
-        self.origDef = defType(target)
-        self.finalDef = defType(target)
-        self.origDef.objx = origX
-        self.origDef.objy = origY
-        self.finalDef.objx = finalX
-        self.finalDef.objy = finalY
+        # Only the position changes, so a single definition of the item's data
+        # is stored together with both positions
+        self.definition = target.instanceDef(target)
+        self.origPos = (origX, origY)
+        self.finalPos = (finalX, finalY)
+
+    def findInstance(self, pos):
+        """
+        Returns the item at the given position, if any
+        """
+        self.definition.objx, self.definition.objy = pos
+        return self.definition.findInstance()
 
     def undo(self):
         """
         Sets the target object's position to the original position
         """
-        instance = self.finalDef.findInstance()
+        instance = self.findInstance(self.finalPos)
         if instance:
-            self.changeObjectPos(instance, self.origDef.objx, self.origDef.objy)
+            self.changeObjectPos(instance, *self.origPos)
         else:
-            print('Undo Move Item: Cannot find item instance! ' + str(self.finalDef))
+            print('Undo Move Item: Cannot find item instance! ' + str(self.definition))
 
     def redo(self):
         """
         Sets the target object's position to the final position
         """
-        instance = self.origDef.findInstance()
+        instance = self.findInstance(self.origPos)
         if instance:
-            self.changeObjectPos(instance, self.finalDef.objx, self.finalDef.objy)
+            self.changeObjectPos(instance, *self.finalPos)
         else:
-            print('Redo Move Item: Cannot find item instance! ' + str(self.origDef))
+            print('Redo Move Item: Cannot find item instance! ' + str(self.definition))
 
     @staticmethod
     def changeObjectPos(object, newX, newY):
@@ -177,23 +182,22 @@ class MoveItemUndoAction(UndoAction):
         """
         Returns True if this MoveItemUndoAction extends another
         """
-        return hasattr(other, 'origDef') and self.origDef.defMatchesData(other.origDef)
+        return hasattr(other, 'definition') and self.definition.defMatchesData(other.definition)
 
     def extend(self, other):
         """
         Extends this MoveItemUndoAction with the data from an extention of it.
         isExtentionOf must have returned True first!
         """
-        self.finalDef.objx = other.finalDef.objx
-        self.finalDef.objy = other.finalDef.objy
+        self.finalPos = other.finalPos
 
     def isNull(self):
         """
         Returns True if this action is effectively a no-op
         """
         matches = True
-        matches = matches and abs(self.origDef.objx - self.finalDef.objx) <= 2
-        matches = matches and abs(self.origDef.objy - self.finalDef.objy) <= 2
+        matches = matches and abs(self.origPos[0] - self.finalPos[0]) <= 2
+        matches = matches and abs(self.origPos[1] - self.finalPos[1]) <= 2
         return matches
 
 